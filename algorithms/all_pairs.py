@@ -0,0 +1,248 @@
+"""
+All-pairs reachability and hop distances for graphs of up to a few tens of thousands of vertices.
+
+Running `bfs` from every vertex costs V traversals, each with one Python iteration per edge.
+Instead, this engine runs all V traversals together, level by level, on bitsets
+(arbitrary-precision Python ints, as in bit_matrix.py):
+
+- seen[v]: bit t is set when v can reach t, i.e. row v of the reachability matrix
+- frontier[v]: the vertices first reached from v at the current level
+
+A vertex reaches at level L + 1 whatever its out-neighbors reached for the first time at level L:
+
+    frontier'[v] = (OR of frontier[u] for every edge v -> u) & ~seen[v]
+
+Each OR handles all V targets in one operation of V / 64 machine words, so a level costs
+E row operations. Only the vertices with an edge into a non-empty frontier are recomputed.
+
+1. `transitive_closure` keeps only `seen`: the bitset rows of the reachability matrix.
+2. `all_pairs_distances` also writes the level at which every bit appears into a compact
+   distance matrix: uint8 while the distances fit, switching to uint16 once a path of 255 hops
+   shows up. The largest value of the type (`UNREACHABLE[typecode]`) marks unreachable pairs.
+   With NumPy the matrix is a 2D array and every row is written with one vectorized assignment.
+   Without NumPy it is a list of `array.array` rows, and the uint8 rows are assembled from
+   byte strings with `bytes.translate` instead of being written one entry at a time.
+
+The matrix needs V^2 bytes (2 V^2 with uint16), so a `memory_limit` guards against graphs that are
+too large for an all-pairs answer.
+
+The input is an adjacency matrix: a list of lists from `create_adjacency_matrix`, or a BitAdjacencyMatrix.
+A cell (i, j) is the directed edge i -> j, so undirected matrices give symmetric results.
+
+Complexity:
+- Time: O(D * E * V / 64) word operations for D levels, plus O(V^2) to write distances
+- Space: O(V^2 / 8) bytes of bitsets, plus the V^2 distance matrix
+"""
+
+import random
+import time
+from array import array
+from typing import List, Tuple
+
+from data_structures.graph.bit_matrix import BitAdjacencyMatrix, iter_bits
+
+try:
+    import numpy as np
+except ImportError: # NumPy is optional
+    np = None
+
+UNREACHABLE = {'B': 255, 'H': 65535}
+DEFAULT_MEMORY_LIMIT = 1 << 30 # 1 GB
+
+
+def _adjacency(graph) -> Tuple[List[List[int]], List[List[int]]]:
+    """Out-neighbor and in-neighbor lists of an adjacency matrix"""
+    if isinstance(graph, BitAdjacencyMatrix):
+        out_neighbors = [list(iter_bits(row)) for row in graph.rows]
+    else:
+        out_neighbors = [[column for column, weight in enumerate(row) if weight] for row in graph]
+
+    in_neighbors: List[List[int]] = [[] for _ in out_neighbors]
+    for vertex, neighbors in enumerate(out_neighbors):
+        for neighbor in neighbors:
+            in_neighbors[neighbor].append(vertex)
+    return out_neighbors, in_neighbors
+
+
+def _levels(graph):
+    """
+    Level-synchronous all-sources BFS on bitsets.
+    Yields (level, {vertex: bitset of the targets first reached at that level}) and returns the seen rows.
+    """
+    _, in_neighbors = _adjacency(graph)
+    num_vertices = len(in_neighbors)
+    seen = [1 << vertex for vertex in range(num_vertices)]
+    frontier = {vertex: 1 << vertex for vertex in range(num_vertices)}
+    level = 0
+
+    while frontier:
+        level += 1
+        # Push every non-empty frontier to the vertices with an edge into it
+        gathered = {}
+        for vertex, mask in frontier.items():
+            for predecessor in in_neighbors[vertex]:
+                gathered[predecessor] = gathered.get(predecessor, 0) | mask
+
+        frontier = {}
+        for vertex, mask in gathered.items():
+            new = mask & ~seen[vertex]
+            if new:
+                seen[vertex] |= new
+                frontier[vertex] = new
+        if frontier:
+            yield level, frontier
+
+    return seen
+
+
+def transitive_closure(graph) -> List[int]:
+    """
+    Reachability matrix as bitset rows: bit t of row v is set when there is a path from v to t
+    (every vertex reaches itself).
+
+    Example:
+      >>> [bin(row) for row in transitive_closure([[0, 1, 0], [0, 0, 1], [0, 0, 0]])]
+      ['0b111', '0b110', '0b100']
+    """
+    levels = _levels(graph)
+    while True:
+        try:
+            next(levels)
+        except StopIteration as done:
+            return done.value
+
+
+def _spread(mask: int, num_vertices: int, value: int) -> int:
+    """
+    An int whose byte t is `value` where bit t of mask is set and 0 elsewhere.
+    The bits are expanded to one character each by `format` and mapped with `bytes.translate`,
+    so no Python-level loop runs over the vertices.
+    """
+    digits = format(mask, f'0{num_vertices}b')[::-1].encode() # Character t is bit t
+    return int.from_bytes(digits.translate(bytes.maketrans(b'01', bytes((0, value)))), 'little')
+
+
+def _check_memory(num_vertices: int, item_size: int, memory_limit: int):
+    needed = num_vertices * num_vertices * item_size + 2 * num_vertices * ((num_vertices + 7) // 8)
+    if needed > memory_limit:
+        raise ValueError(f"Invalid value of memory_limit: {num_vertices} vertices need about "
+                         f"{needed / 2 ** 20:.0f} MB, the limit is {memory_limit / 2 ** 20:.0f} MB")
+
+
+def all_pairs_distances(graph, memory_limit: int = DEFAULT_MEMORY_LIMIT):
+    """
+    Hop distance between every ordered pair of vertices.
+
+    Args:
+      graph: Adjacency matrix (list of lists or BitAdjacencyMatrix).
+      memory_limit (int): Maximum bytes for the distance matrix plus the bitsets.
+    Returns:
+      The V x V distance matrix: a NumPy uint8/uint16 array, or a list of array('B')/array('H') rows
+      without NumPy. matrix[i][j] is the number of edges on a shortest path from i to j,
+      UNREACHABLE['B'] (255) or UNREACHABLE['H'] (65535) when there is none.
+    Example:
+      >>> [list(row) for row in all_pairs_distances([[0, 1, 0], [1, 0, 0], [0, 0, 0]])]
+      [[0, 1, 255], [1, 0, 255], [255, 255, 0]]
+    """
+    num_vertices = len(graph)
+    typecode = 'B'
+    _check_memory(num_vertices, 1, memory_limit)
+    num_bytes = (num_vertices + 7) // 8
+
+    if np is not None:
+        matrix = np.full((num_vertices, num_vertices), UNREACHABLE['B'], dtype=np.uint8)
+        np.fill_diagonal(matrix, 0)
+    else:
+        # uint8 rows are built as ints whose byte t is the distance to t (see _spread)
+        packed = [0] * num_vertices
+        matrix = None
+
+    levels = _levels(graph)
+    while True:
+        try:
+            level, frontier = next(levels)
+        except StopIteration as done:
+            seen = done.value
+            break
+
+        if level == UNREACHABLE['B'] and typecode == 'B':
+            # Distances no longer fit in a byte
+            _check_memory(num_vertices, 2, memory_limit)
+            typecode = 'H'
+            if np is not None:
+                unreached = matrix == UNREACHABLE['B']
+                matrix = matrix.astype(np.uint16)
+                matrix[unreached] = UNREACHABLE['H']
+            else:
+                matrix = [array('H', list(value.to_bytes(num_vertices, 'little'))) for value in packed]
+                for row in matrix:
+                    for target in range(num_vertices):
+                        if row[target] == 0:
+                            row[target] = UNREACHABLE['H']
+                for vertex in range(num_vertices):
+                    matrix[vertex][vertex] = 0
+                del packed
+
+        for vertex, mask in frontier.items():
+            if np is not None:
+                bits = np.frombuffer(mask.to_bytes(num_bytes, 'little'), dtype=np.uint8)
+                matrix[vertex, np.unpackbits(bits, count=num_vertices, bitorder='little').view(bool)] = level
+            elif typecode == 'B':
+                packed[vertex] |= _spread(mask, num_vertices, level)
+            else:
+                row = matrix[vertex]
+                for target in iter_bits(mask):
+                    row[target] = level
+
+    if np is None and typecode == 'B':
+        everything = (1 << num_vertices) - 1
+        matrix = [array('B', (value | _spread(everything & ~seen[vertex], num_vertices, UNREACHABLE['B']))
+                        .to_bytes(num_vertices, 'little'))
+                  for vertex, value in enumerate(packed)]
+    return matrix
+
+
+def benchmark(num_vertices: int = 2_000, m: int = 4):
+    """Compare bfs_levels from every vertex with the bitset engine on a power-law graph"""
+    from algorithms.bfs import bfs_levels
+    from data_structures.graph.bit_matrix import create_bit_matrix
+    from data_structures.graph.generators import edges_to_adjacency_list, power_law_edges
+
+    edges = power_law_edges(num_vertices, m)
+    adj_list = edges_to_adjacency_list(num_vertices, edges)
+    bit_matrix = create_bit_matrix(num_vertices)
+    for i, j in edges:
+        bit_matrix.add_edge(i, j)
+    print(f"power-law graph, {num_vertices:,} vertices, {len(edges):,} edges, "
+          f"{'NumPy' if np is not None else 'pure-Python'} distance matrix")
+
+    start = time.perf_counter()
+    expected = [bfs_levels(adj_list, source) for source in range(num_vertices)]
+    print(f"{'bfs_levels x V':>20}: {time.perf_counter() - start:.2f}s")
+
+    start = time.perf_counter()
+    closure = transitive_closure(bit_matrix)
+    print(f"{'transitive_closure':>20}: {time.perf_counter() - start:.2f}s")
+
+    start = time.perf_counter()
+    matrix = all_pairs_distances(bit_matrix)
+    print(f"{'all_pairs_distances':>20}: {time.perf_counter() - start:.2f}s")
+
+    sample = random.Random(0).sample(range(num_vertices), 20)
+    print(all([int(value) if value != UNREACHABLE['B'] else -1 for value in matrix[source]] == expected[source]
+              and closure[source].bit_count() == sum(level >= 0 for level in expected[source])
+              for source in sample))  # Output: True
+
+
+if __name__ == "__main__":
+    from data_structures.graph.graph import add_edge_adj_mat, create_adjacency_matrix
+
+    # Path 0 - 1 - 2 and an isolated vertex 3
+    adj_matrix = create_adjacency_matrix(4)
+    add_edge_adj_mat(adj_matrix, 0, 1)
+    add_edge_adj_mat(adj_matrix, 1, 2)
+    print([bin(row) for row in transitive_closure(adj_matrix)])  # Output: ['0b111', '0b111', '0b111', '0b1000']
+    print([list(map(int, row)) for row in all_pairs_distances(adj_matrix)])
+    # Output: [[0, 1, 2, 255], [1, 0, 1, 255], [2, 1, 0, 255], [255, 255, 255, 0]]
+
+    benchmark()
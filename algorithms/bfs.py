@@ -16,8 +16,25 @@ Complexity:
 - Space Complexity: O(V), where V is the number of vertices (for the visited array and queue).
 
 
+`iter_bfs` is a lazy version that yields (vertex, depth, parent) one at a time, so a caller
+looking for the first match, or only the first few levels, can stop without visiting the rest.
+
+Direction-optimizing BFS:
+The usual (top-down) step scans the edges of every frontier vertex. On low-diameter graphs,
+such as social networks, the middle levels contain most of the vertices, and most of the
+edges scanned lead to vertices that are already visited. A bottom-up step turns this around:
+every unvisited vertex looks for any neighbor in the frontier and stops at the first one found.
+`direction_optimizing_bfs` switches between the two with the heuristic of Beamer et al.:
+
+- Top-down -> bottom-up when the frontier's edges exceed the unexplored edges / alpha
+- Bottom-up -> top-down when the frontier shrinks below num_vertices / beta
+
+Both steps discover exactly the vertices of the next level, so the levels are the same as a plain BFS.
 """
-from typing import List
+import random
+import time
+from collections import deque
+from typing import Callable, Iterator, List, Optional, Tuple
 
 
 def bfs(graph: List[List], start:int=0) -> List[int]:
@@ -44,20 +61,20 @@ def bfs(graph: List[List], start:int=0) -> List[int]:
     # Create an array to store the traversal
     result = []
 
-    # Create a queue for BFS
-    queue = []
+    # Create a queue for BFS (popleft on a deque is O(1), list.pop(0) is O(n))
+    queue = deque()
 
     # Create a visited array to keep track of visited nodes
     visited = [False] * num_vertices
 
     # Mark source node as visited and enqueue it
-    visited[0] = True
+    visited[start] = True
     queue.append(start)
 
     # While the queue is not empty
     while queue:
         # Dequeue a vertex from the queue and add it to the result
-        vertex = queue.pop(0)
+        vertex = queue.popleft()
         result.append(vertex)
 
         # Get all adjacent vertices of the dequeued vertex
@@ -77,8 +94,8 @@ def bfs_of_graph(graph: List[List], visited: List[bool],
     It handles disconnected graphs by iterating through all nodes.
     """
 
-    # Create a queue for BFS
-    queue = []
+    # Create a queue for BFS (popleft on a deque is O(1), list.pop(0) is O(n))
+    queue = deque()
 
     # Mark the source node as visited and enqueue it
     visited[start] = True
@@ -87,7 +104,7 @@ def bfs_of_graph(graph: List[List], visited: List[bool],
     # While the queue is not empty
     while queue:
         # Dequeue a vertex from the queue and add it to the result
-        vertex = queue.pop(0)
+        vertex = queue.popleft()
         result.append(vertex)
 
         # Get all adjacent vertices of the dequeued vertex
@@ -120,4 +137,190 @@ def dfs_disconnected(graph: List[List]) -> List[int]:
         if not visited[vertex]:
             bfs_of_graph(graph, visited, result, vertex)
 
-    return result
\ No newline at end of file
+    return result
+
+
+def iter_bfs(graph: List[List], start: int = 0, max_depth: Optional[int] = None,
+             stop: Optional[Callable[[int, int], bool]] = None,
+             on_level: Optional[Callable[[int, List[int]], Optional[bool]]] = None
+             ) -> Iterator[Tuple[int, int, int]]:
+    """
+    Lazy BFS that yields (vertex, depth, parent) in visit order, the start vertex having parent -1.
+    Nothing is computed beyond what the caller consumes, so breaking out of the loop ends the traversal.
+
+    Args:
+      graph (List[List]): Adjacency list (or CSRGraph).
+      start (int): The source vertex.
+      max_depth (Optional[int]): Do not go deeper than this many edges from start.
+      stop (Optional[Callable[[int, int], bool]]): Called with (vertex, depth) for every visited vertex.
+        The traversal ends right after the first vertex for which it returns True has been yielded.
+      on_level (Optional[Callable[[int, List[int]], Optional[bool]]]): Called with (depth, vertices)
+        once every vertex of a level has been yielded. Returning True ends the traversal.
+    Example:
+      >>> list(iter_bfs([[1, 2], [0, 3], [0], [1]], 0, max_depth=1))
+      [(0, 0, -1), (1, 1, 0), (2, 1, 0)]
+    """
+    if max_depth is not None and max_depth < 0:
+        raise ValueError("Invalid value of max_depth")
+
+    visited = [False] * len(graph)
+    visited[start] = True
+    queue = deque([(start, 0, -1)])
+    level: List[int] = []
+    level_depth = 0
+
+    while queue:
+        vertex, depth, parent = queue.popleft()
+
+        if on_level is not None and depth != level_depth:
+            if on_level(level_depth, level):
+                return
+            level, level_depth = [], depth
+
+        yield vertex, depth, parent
+        if stop is not None and stop(vertex, depth):
+            return
+        if on_level is not None:
+            level.append(vertex)
+
+        if max_depth is None or depth < max_depth:
+            for neighbor in graph[vertex]:
+                if not visited[neighbor]:
+                    visited[neighbor] = True
+                    queue.append((neighbor, depth + 1, vertex))
+
+    if on_level is not None and level:
+        on_level(level_depth, level)
+
+
+def bfs_levels(graph: List[List], start: int = 0) -> List[int]:
+    """
+    Level-synchronous top-down BFS.
+    Returns the level (number of edges from start) of every vertex, -1 for unreachable vertices.
+    """
+    levels = [-1] * len(graph)
+    levels[start] = 0
+    frontier = [start]
+    depth = 0
+
+    while frontier:
+        depth += 1
+        next_frontier = []
+        for vertex in frontier:
+            for neighbor in graph[vertex]:
+                if levels[neighbor] == -1:
+                    levels[neighbor] = depth
+                    next_frontier.append(neighbor)
+        frontier = next_frontier
+
+    return levels
+
+
+def direction_optimizing_bfs(graph: List[List], start: int = 0, alpha: float = 14.0, beta: float = 24.0,
+                             reverse_graph: Optional[List[List]] = None) -> List[int]:
+    """
+    BFS that switches between top-down and bottom-up steps.
+
+    Args:
+      graph (List[List]): Adjacency list (or CSRGraph).
+      start (int): The source vertex.
+      alpha (float): Go bottom-up when the frontier's edges exceed the unexplored edges / alpha.
+        Smaller values switch earlier.
+      beta (float): Go back top-down when the frontier has fewer than num_vertices / beta vertices.
+        Larger values stay bottom-up longer.
+      reverse_graph (Optional[List[List]]): In-neighbors of every vertex for directed graphs.
+        The bottom-up step needs them. An undirected graph is its own reverse.
+    Returns:
+      List[int]: The level of every vertex, -1 for unreachable vertices (same as `bfs_levels`).
+    Example:
+      >>> direction_optimizing_bfs([[1, 2], [0], [0], []], 0)
+      [0, 1, 1, -1]
+    """
+    if alpha <= 0:
+        raise ValueError("Invalid value of alpha")
+    if beta <= 0:
+        raise ValueError("Invalid value of beta")
+
+    num_vertices = len(graph)
+    parents_graph = graph if reverse_graph is None else reverse_graph
+
+    levels = [-1] * num_vertices
+    levels[start] = 0
+    frontier = [start]
+    # Unvisited vertices, only materialized while the search runs bottom-up
+    unvisited: Optional[List[int]] = None
+    degrees = [len(graph[vertex]) for vertex in range(num_vertices)]
+    # Edges leaving vertices that are not visited yet (the frontier's are subtracted as it is reached)
+    unexplored_edges = sum(degrees)
+    bottom_up = False
+    depth = 0
+
+    while frontier:
+        depth += 1
+        frontier_edges = sum(degrees[vertex] for vertex in frontier)
+        unexplored_edges -= frontier_edges
+
+        if not bottom_up and frontier_edges > unexplored_edges / alpha:
+            bottom_up = True
+            # One O(V) scan per switch; top-down steps never touch the list
+            unvisited = [vertex for vertex in range(num_vertices) if levels[vertex] == -1]
+        elif bottom_up and len(frontier) < num_vertices / beta:
+            bottom_up = False
+            unvisited = None
+
+        next_frontier = []
+        if bottom_up:
+            # Every unvisited vertex looks for a parent in the frontier (the vertices at depth - 1)
+            parent_level = depth - 1
+            still_unvisited = []
+            for vertex in unvisited:
+                for neighbor in parents_graph[vertex]:
+                    if levels[neighbor] == parent_level:
+                        levels[vertex] = depth
+                        next_frontier.append(vertex)
+                        break
+                else:
+                    still_unvisited.append(vertex)
+            unvisited = still_unvisited
+        else:
+            for vertex in frontier:
+                for neighbor in graph[vertex]:
+                    if levels[neighbor] == -1:
+                        levels[neighbor] = depth
+                        next_frontier.append(neighbor)
+
+        frontier = next_frontier
+
+    return levels
+
+
+def benchmark(num_vertices: int = 200_000, m: int = 8, sources: int = 5):
+    """Compare bfs, top-down bfs_levels and direction_optimizing_bfs on a power-law graph"""
+    from data_structures.graph.generators import edges_to_adjacency_list, power_law_edges
+
+    graph = edges_to_adjacency_list(num_vertices, power_law_edges(num_vertices, m))
+    starts = [random.Random(0).randrange(num_vertices) for _ in range(sources)]
+
+    print(f"power-law graph, {num_vertices:,} vertices, {sum(map(len, graph)) // 2:,} edges")
+    for name, traversal in (("bfs", bfs), ("bfs_levels", bfs_levels),
+                            ("direction_optimizing_bfs", direction_optimizing_bfs)):
+        start_time = time.perf_counter()
+        for start in starts:
+            traversal(graph, start)
+        print(f"{name:>25}: {(time.perf_counter() - start_time) / sources:.3f}s per source")
+
+
+if __name__ == "__main__":
+    graph = [[1, 2], [0, 3], [0, 3], [1, 2], []]
+    print(bfs(graph, 0))                       # Output: [0, 1, 2, 3]
+    print(bfs_levels(graph, 0))                # Output: [0, 1, 1, 2, -1]
+    print(direction_optimizing_bfs(graph, 0))  # Output: [0, 1, 1, 2, -1]
+
+    # First vertex of degree 2 other than the start, then stop
+    print(next(vertex for vertex, depth, _ in iter_bfs(graph, 0) if depth and len(graph[vertex]) == 2))  # Output: 1
+    # Per-level hook, stopping once level 1 is complete
+    levels = []
+    list(iter_bfs(graph, 0, on_level=lambda depth, vertices: levels.append((depth, vertices)) or depth == 1))
+    print(levels)  # Output: [(0, [0]), (1, [1, 2])]
+
+    benchmark()
@@ -0,0 +1,165 @@
+"""
+Bidirectional BFS finds a shortest (fewest hops) path between two vertices by searching
+from both ends at the same time.
+
+A BFS from s that stops at t still visits every vertex closer to s than t. If each vertex has
+about b neighbors and t is d hops away, that is about b^d vertices. Two searches, one forward
+from s and one backward from t, meet in the middle after about d / 2 levels each, so they visit
+about 2 * b^(d / 2) vertices instead. On a power-law graph with a small diameter this cuts
+the work from most of the graph to a small fraction of it.
+
+How it works:
+1. Keep a frontier and parent pointers for each side.
+2. Expand one full level of the side whose frontier is smaller (the cheaper side to grow).
+3. A vertex discovered by one side that the other side already reached is a meeting point.
+   Once a level produces meeting points, the one with the smallest total distance lies on
+   a shortest path, and the path is rebuilt from both sets of parent pointers.
+
+For a directed graph, the backward search must follow edges in reverse, so it needs the
+reverse adjacency (the in-neighbors of every vertex). An undirected graph is its own reverse.
+
+Parents and distances are kept in dicts, so a query touches only the vertices it explores
+instead of allocating arrays of size V.
+
+Complexity:
+- Time: O(b^(d / 2)) vertices expanded for branching factor b and distance d, O(V + E) at worst
+- Space: O(number of explored vertices)
+"""
+
+import random
+import time
+from typing import Dict, List, Tuple
+
+
+def _walk(parents: Dict[int, int], vertex: int) -> List[int]:
+    """Follow parent pointers from the vertex back to the root of the search"""
+    path = [vertex]
+    while parents[path[-1]] != -1:
+        path.append(parents[path[-1]])
+    return path
+
+
+def _search(graph, source: int, target: int, reverse_graph=None) -> Tuple[List[int], int]:
+    """Bidirectional BFS. Returns the path ([] if unreachable) and the number of expanded vertices."""
+    if source == target:
+        return [source], 0
+
+    backward_graph = graph if reverse_graph is None else reverse_graph
+    forward = ({source: -1}, {source: 0}, [source], graph)
+    backward = ({target: -1}, {target: 0}, [target], backward_graph)
+    expanded = 0
+
+    while forward[2] and backward[2]:
+        # Grow the smaller frontier
+        is_forward = len(forward[2]) <= len(backward[2])
+        parents, distances, frontier, adjacency = forward if is_forward else backward
+        other_distances = backward[1] if is_forward else forward[1]
+
+        best_total, meeting = None, -1
+        next_frontier = []
+        for vertex in frontier:
+            expanded += 1
+            distance = distances[vertex] + 1
+            for neighbor in adjacency[vertex]:
+                neighbor = int(neighbor)
+                if neighbor in parents:
+                    continue
+                parents[neighbor] = vertex
+                distances[neighbor] = distance
+                next_frontier.append(neighbor)
+                if neighbor in other_distances:
+                    total = distance + other_distances[neighbor]
+                    if best_total is None or total < best_total:
+                        best_total, meeting = total, neighbor
+
+        if is_forward:
+            forward = (parents, distances, next_frontier, adjacency)
+        else:
+            backward = (parents, distances, next_frontier, adjacency)
+
+        if meeting != -1:
+            path = _walk(forward[0], meeting)[::-1] + _walk(backward[0], meeting)[1:]
+            return path, expanded
+
+    return [], expanded
+
+
+def bidirectional_bfs(graph, source: int, target: int, reverse_graph=None) -> Tuple[int, List[int]]:
+    """
+    Shortest hop path from source to target.
+
+    Args:
+      graph: Adjacency list or CSRGraph.
+      source (int): Start of the path.
+      target (int): End of the path.
+      reverse_graph: In-neighbors of every vertex, required for directed graphs.
+        Leave it out for undirected graphs.
+    Returns:
+      Tuple[int, List[int]]: The number of hops and the vertices on the path, (-1, []) if unreachable.
+    Example:
+      >>> bidirectional_bfs([[1], [0, 2], [1, 3], [2]], 0, 3)
+      (3, [0, 1, 2, 3])
+    """
+    num_vertices = len(graph)
+    if not 0 <= source < num_vertices:
+        raise ValueError("Invalid value of source")
+    if not 0 <= target < num_vertices:
+        raise ValueError("Invalid value of target")
+
+    path, _ = _search(graph, source, target, reverse_graph)
+    return len(path) - 1 if path else -1, path
+
+
+def reverse_adjacency(graph) -> List[List[int]]:
+    """In-neighbors of every vertex of a directed adjacency list"""
+    reverse: List[List[int]] = [[] for _ in range(len(graph))]
+    for vertex in range(len(graph)):
+        for neighbor in graph[vertex]:
+            reverse[int(neighbor)].append(vertex)
+    return reverse
+
+
+def benchmark(grid_side: int = 300, power_law_vertices: int = 100_000, queries: int = 20):
+    """
+    Expanded vertices and latency per query: full bfs, bfs stopped at the target (iter_bfs)
+    and bidirectional_bfs, on road-like and power-law graphs.
+    """
+    from algorithms.bfs import bfs, iter_bfs
+    from data_structures.graph.csr_graph import CSRGraph
+    from data_structures.graph.generators import grid_edges, power_law_edges
+
+    graphs = {
+        "road-like grid": CSRGraph.from_edges(grid_side * grid_side, grid_edges(grid_side, grid_side)),
+        "power-law": CSRGraph.from_edges(power_law_vertices, power_law_edges(power_law_vertices)),
+    }
+
+    def early_exit(graph, source, target):
+        return sum(1 for _ in iter_bfs(graph, source, stop=lambda vertex, _: vertex == target))
+
+    print(f"{'graph':>15} | {'method':>14} | {'expanded':>9} | {'ms/query':>8}")
+    for name, graph in graphs.items():
+        rng = random.Random(0)
+        pairs = [(rng.randrange(len(graph)), rng.randrange(len(graph))) for _ in range(queries)]
+        methods = (
+            ("bfs", lambda s, t: len(bfs(graph, s))),
+            ("bfs + stop", lambda s, t: early_exit(graph, s, t)),
+            ("bidirectional", lambda s, t: _search(graph, s, t)[1]),
+        )
+        for method, run in methods:
+            start = time.perf_counter()
+            expanded = sum(run(source, target) for source, target in pairs)
+            elapsed = (time.perf_counter() - start) / queries
+            print(f"{name:>15} | {method:>14} | {expanded // queries:>9,} | {elapsed * 1000:>8.1f}")
+
+
+if __name__ == "__main__":
+    # Undirected: a square 0 - 1 - 2 - 3 - 0 with a tail 3 - 4
+    square = [[1, 3], [0, 2], [1, 3], [2, 0, 4], [3]]
+    print(bidirectional_bfs(square, 1, 4))  # Output: (3, [1, 2, 3, 4])
+
+    # Directed: 0 -> 1 -> 2 and 2 -> 0, so 2 reaches 1 only through 0
+    directed = [[1], [2], [0]]
+    print(bidirectional_bfs(directed, 2, 1, reverse_adjacency(directed)))  # Output: (2, [2, 0, 1])
+    print(bidirectional_bfs([[1], [], []], 0, 2, [[], [0], []]))           # Output: (-1, [])
+
+    benchmark()
@@ -0,0 +1,214 @@
+"""
+Dijkstra's algorithm finds the shortest paths from a source vertex to every other vertex
+in a graph with non-negative edge weights.
+
+It keeps a tentative distance for every vertex and repeatedly settles the unsettled vertex
+with the smallest distance, relaxing its outgoing edges.
+BFS solves the same problem only when every edge has the same weight.
+
+Two priority queues are supported:
+
+1. Binary heap (`heapq`) with lazy deletion:
+   Instead of a decrease-key operation, an improved distance is simply pushed again.
+   Outdated entries are recognised and skipped when they are popped
+   (their distance is larger than the best one recorded).
+
+2. Bucket queue (Dial's algorithm):
+   For small non-negative integer weights (at most C), bucket d holds the vertices at tentative distance d.
+   Only C + 1 buckets are ever in use at once, so they are reused circularly.
+   Each operation is O(1) and the scan over the buckets costs O(V * C) in total.
+
+Options:
+- Early exit: stop as soon as the target is settled, its distance is then final.
+- Path reconstruction: record the parent of every vertex and walk back from the target.
+
+The graph can be a weighted adjacency list (lists of (neighbor, weight) pairs as built by
+`add_edge_weighted_adj_list`) or a CSRGraph with weights.
+
+Complexity:
+- Heap: O((V + E) log V) time, O(V + E) space (the heap can hold one entry per relaxation)
+- Bucket queue: O(V * C + E) time, O(V + C) space
+"""
+
+import heapq
+import math
+import random
+import time
+from typing import Iterable, List, Optional, Tuple
+
+from data_structures.graph.csr_graph import CSRGraph
+from data_structures.graph.generators import grid_edges, power_law_edges, random_weights
+
+INF = math.inf
+
+
+def _neighbors(graph, vertex: int) -> Iterable[Tuple[int, float]]:
+    """(neighbor, weight) pairs of a vertex for either supported graph form"""
+    if hasattr(graph, "weighted_neighbors"):
+        return graph.weighted_neighbors(vertex)
+    return graph[vertex]
+
+
+def _dijkstra_heap(graph, source: int, target: Optional[int], parents: Optional[List[int]]) -> List[float]:
+    """Dijkstra with a binary heap and lazy deletion"""
+    distances = [INF] * len(graph)
+    distances[source] = 0
+    heap = [(0, source)]
+
+    while heap:
+        distance, vertex = heapq.heappop(heap)
+
+        # Skip outdated entries, a shorter distance was already found
+        if distance > distances[vertex]:
+            continue
+
+        if vertex == target:
+            break
+
+        for neighbor, weight in _neighbors(graph, vertex):
+            new_distance = distance + weight
+            if new_distance < distances[neighbor]:
+                distances[neighbor] = new_distance
+                if parents is not None:
+                    parents[neighbor] = vertex
+                heapq.heappush(heap, (new_distance, neighbor))
+
+    return distances
+
+
+def _dijkstra_buckets(graph, source: int, target: Optional[int], parents: Optional[List[int]],
+                      max_weight: Optional[int]) -> List[float]:
+    """Dijkstra with a circular bucket queue (Dial's algorithm) for small integer weights"""
+    if max_weight is None:
+        max_weight = max((weight for vertex in range(len(graph)) for _, weight in _neighbors(graph, vertex)),
+                         default=0)
+
+    num_buckets = int(max_weight) + 1
+    buckets: List[List[int]] = [[] for _ in range(num_buckets)]
+    distances = [INF] * len(graph)
+    distances[source] = 0
+    buckets[0].append(source)
+    pending = 1 # Entries in all buckets, including outdated ones
+    current = 0
+
+    while pending:
+        # Move to the next non-empty bucket
+        bucket = buckets[current % num_buckets]
+        while not bucket:
+            current += 1
+            bucket = buckets[current % num_buckets]
+
+        vertex = bucket.pop()
+        pending -= 1
+
+        # Skip outdated entries, the vertex was moved to a closer bucket
+        if distances[vertex] != current:
+            continue
+
+        if vertex == target:
+            break
+
+        for neighbor, weight in _neighbors(graph, vertex):
+            new_distance = current + int(weight)
+            if new_distance < distances[neighbor]:
+                distances[neighbor] = new_distance
+                if parents is not None:
+                    parents[neighbor] = vertex
+                buckets[new_distance % num_buckets].append(neighbor)
+                pending += 1
+
+    return distances
+
+
+def dijkstra(graph, source: int = 0, target: Optional[int] = None, track_parents: bool = False,
+             bucket_queue: bool = False, max_weight: Optional[int] = None
+             ) -> Tuple[List[float], Optional[List[int]]]:
+    """
+    Compute shortest path distances from `source`.
+
+    Args:
+      graph: Weighted adjacency list of (neighbor, weight) pairs, or a CSRGraph with weights.
+      source (int): The start vertex.
+      target (Optional[int]): Stop as soon as this vertex is settled. Distances of vertices
+        that were not settled yet are then only upper bounds.
+      track_parents (bool): Also return the parent of every vertex on its shortest path.
+      bucket_queue (bool): Use a bucket queue instead of a heap. Weights must be non-negative integers.
+      max_weight (Optional[int]): Largest edge weight for the bucket queue, computed if omitted.
+    Returns:
+      Tuple[List[float], Optional[List[int]]]: The distances (math.inf when unreachable)
+      and the parents (-1 for the source and unreached vertices), or None without track_parents.
+    Example:
+      >>> graph = [[(1, 4), (2, 1)], [(0, 4), (2, 2)], [(0, 1), (1, 2)]]
+      >>> dijkstra(graph, 0)[0]
+      [0, 3, 1]
+    """
+    parents = [-1] * len(graph) if track_parents else None
+    if bucket_queue:
+        distances = _dijkstra_buckets(graph, source, target, parents, max_weight)
+    else:
+        distances = _dijkstra_heap(graph, source, target, parents)
+    return distances, parents
+
+
+def reconstruct_path(parents: List[int], source: int, target: int) -> List[int]:
+    """Walk the parent pointers back from target to source. Returns [] if target is unreachable."""
+    if target != source and parents[target] == -1:
+        return []
+
+    path = [target]
+    while path[-1] != source:
+        path.append(parents[path[-1]])
+    path.reverse()
+    return path
+
+
+def shortest_path(graph, source: int, target: int, bucket_queue: bool = False) -> Tuple[float, List[int]]:
+    """
+    Shortest path from source to target, stopping as soon as the target is settled.
+    Returns the distance and the list of vertices on the path (math.inf and [] if unreachable).
+    """
+    distances, parents = dijkstra(graph, source, target, track_parents=True, bucket_queue=bucket_queue)
+    return distances[target], reconstruct_path(parents, source, target)
+
+
+def benchmark(grid_side: int = 200, power_law_vertices: int = 40_000, queries: int = 5):
+    """Time full and early-exit runs of both queue modes on road-like and power-law graphs"""
+    graphs = {
+        "road-like grid": (grid_side * grid_side, grid_edges(grid_side, grid_side)),
+        "power-law": (power_law_vertices, power_law_edges(power_law_vertices)),
+    }
+
+    print(f"{'graph':>15} | {'queue':>6} | {'full run (s)':>12} | {'to target (s)':>13}")
+    for name, (num_vertices, edges) in graphs.items():
+        graph = CSRGraph.from_edges(num_vertices, edges, weights=random_weights(len(edges)))
+        rng = random.Random(0)
+        pairs = [(rng.randrange(num_vertices), rng.randrange(num_vertices)) for _ in range(queries)]
+
+        for bucket_queue in (False, True):
+            start = time.perf_counter()
+            for source, _ in pairs:
+                dijkstra(graph, source, bucket_queue=bucket_queue, max_weight=10)
+            full = (time.perf_counter() - start) / queries
+
+            start = time.perf_counter()
+            for source, target in pairs:
+                dijkstra(graph, source, target, bucket_queue=bucket_queue, max_weight=10)
+            early = (time.perf_counter() - start) / queries
+
+            print(f"{name:>15} | {'bucket' if bucket_queue else 'heap':>6} | {full:>12.3f} | {early:>13.3f}")
+
+
+if __name__ == "__main__":
+    from data_structures.graph.graph import add_edge_weighted_adj_list, create_adjacency_list
+
+    weighted_graph = create_adjacency_list(4)
+    add_edge_weighted_adj_list(weighted_graph, 0, 1, 4)
+    add_edge_weighted_adj_list(weighted_graph, 0, 2, 1)
+    add_edge_weighted_adj_list(weighted_graph, 2, 1, 2)
+    add_edge_weighted_adj_list(weighted_graph, 1, 3, 5)
+
+    print(dijkstra(weighted_graph, 0)[0])                      # Output: [0, 3, 1, 8]
+    print(shortest_path(weighted_graph, 0, 3))                 # Output: (8, [0, 2, 1, 3])
+    print(shortest_path(weighted_graph, 0, 3, bucket_queue=True))  # Output: (8, [0, 2, 1, 3])
+
+    benchmark()
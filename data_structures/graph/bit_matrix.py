@@ -0,0 +1,177 @@
+"""
+A Bit-packed Adjacency Matrix stores an unweighted graph with one bit per cell.
+
+`create_adjacency_matrix` allocates n x n Python ints: 8 bytes per cell for the list slots alone,
+so a 20,000-vertex graph needs over 3 GB and takes seconds to build. Packing each row into bits
+needs n * n / 8 bytes instead (50 MB for 20,000 vertices).
+
+Each row is stored as one arbitrary-precision Python int used as a bitset: bit j of row i is set
+when there is an edge between i and j. Python executes the bitwise operators on such ints in C,
+one machine word at a time, which turns whole-row questions into a handful of word operations:
+
+- Neighbor set union / intersection: rows[i] | rows[j], rows[i] & rows[j]
+- Degree: popcount of rows[i]
+- Common neighbors of i and j: popcount of rows[i] & rows[j]
+- Triangles: for every edge (i, j) with i < j, the popcount of the common neighbors above j
+
+Indexing works like the list-of-lists matrix (`matrix[i][j]` reads and writes a cell), so
+`add_edge_adj_mat`, `has_edge` and `display_adjacency_matrix` from graph.py accept it directly.
+
+Complexity:
+- has_edge / add_edge: O(n / 64) word operations (ints are immutable, so a write rebuilds the row)
+- Row union, intersection, degree, common neighbors: O(n / 64)
+- Triangle counting: O(E * n / 64)
+- Space: O(n^2 / 8) bytes
+"""
+
+from typing import Iterator, List
+
+
+def iter_bits(mask: int) -> Iterator[int]:
+    """Yield the positions of the set bits of a bitset, lowest first"""
+    while mask:
+        lowest = mask & -mask
+        yield lowest.bit_length() - 1
+        mask ^= lowest
+
+
+class BitRow:
+    """A view of one matrix row so that `matrix[i][j]` reads and writes single bits"""
+    def __init__(self, matrix: "BitAdjacencyMatrix", row: int):
+        self.matrix = matrix
+        self.row = row
+
+    def __getitem__(self, column: int) -> int:
+        return (self.matrix.rows[self.row] >> column) & 1
+
+    def __setitem__(self, column: int, weight: int):
+        # Any non-zero weight sets the bit: this matrix only records whether an edge exists
+        if weight:
+            self.matrix.rows[self.row] |= 1 << column
+        else:
+            self.matrix.rows[self.row] &= ~(1 << column)
+
+    def __iter__(self) -> Iterator[int]:
+        mask = self.matrix.rows[self.row]
+        return ((mask >> column) & 1 for column in range(self.matrix.num_vertices))
+
+    def __len__(self):
+        return self.matrix.num_vertices
+
+
+class BitAdjacencyMatrix:
+    """
+    An unweighted adjacency matrix with each row packed into a Python int bitset.
+    """
+    def __init__(self, num_vertices: int):
+        self.num_vertices = num_vertices
+        self.rows: List[int] = [0] * num_vertices
+
+    def __len__(self):
+        return self.num_vertices
+
+    def __getitem__(self, row: int) -> BitRow:
+        return BitRow(self, row)
+
+    def __iter__(self) -> Iterator[BitRow]:
+        return (BitRow(self, row) for row in range(self.num_vertices))
+
+    def add_edge(self, i: int, j: int):
+        """Add an undirected edge between i and j"""
+        self.rows[i] |= 1 << j
+        self.rows[j] |= 1 << i
+
+    def remove_edge(self, i: int, j: int):
+        """Remove the undirected edge between i and j"""
+        self.rows[i] &= ~(1 << j)
+        self.rows[j] &= ~(1 << i)
+
+    def has_edge(self, i: int, j: int) -> bool:
+        """Check whether there is an edge from i to j"""
+        return (self.rows[i] >> j) & 1 == 1
+
+    def neighbors(self, vertex: int) -> List[int]:
+        """Neighbors of the vertex in increasing order"""
+        return list(iter_bits(self.rows[vertex]))
+
+    def degree(self, vertex: int) -> int:
+        """Number of neighbors, by popcount of the row"""
+        return self.rows[vertex].bit_count()
+
+    def neighbor_union(self, i: int, j: int) -> int:
+        """Bitset of the vertices adjacent to i or j"""
+        return self.rows[i] | self.rows[j]
+
+    def neighbor_intersection(self, i: int, j: int) -> int:
+        """Bitset of the vertices adjacent to both i and j"""
+        return self.rows[i] & self.rows[j]
+
+    def common_neighbors(self, i: int, j: int) -> int:
+        """Number of vertices adjacent to both i and j"""
+        return (self.rows[i] & self.rows[j]).bit_count()
+
+    def jaccard(self, i: int, j: int) -> float:
+        """Jaccard similarity of the neighbor sets of i and j"""
+        union = (self.rows[i] | self.rows[j]).bit_count()
+        return (self.rows[i] & self.rows[j]).bit_count() / union if union else 0.0
+
+    def count_triangles(self) -> int:
+        """
+        Count triangles in an undirected graph.
+        For every edge (i, j) with i < j, the common neighbors k > j close a triangle,
+        so each triangle is counted exactly once.
+        """
+        rows = self.rows
+        triangles = 0
+        for i in range(self.num_vertices):
+            higher = rows[i] >> (i + 1) << (i + 1) # Neighbors of i greater than i
+            for j in iter_bits(higher):
+                triangles += ((rows[i] & rows[j]) >> (j + 1)).bit_count()
+        return triangles
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes of bitset data (not counting the Python object headers)"""
+        return self.num_vertices * ((self.num_vertices + 7) // 8)
+
+
+def create_bit_matrix(num_vertices: int) -> BitAdjacencyMatrix:
+    """Create a bit-packed adjacency matrix for a graph with the specified number of vertices."""
+    return BitAdjacencyMatrix(num_vertices)
+
+
+if __name__ == '__main__':
+    import random
+    import time
+
+    from data_structures.graph.graph import (add_edge_adj_mat, create_adjacency_matrix,
+                                             display_adjacency_matrix, has_edge)
+
+    # Same triangle as in graph.py
+    bit_matrix = create_bit_matrix(3)
+    add_edge_adj_mat(bit_matrix, 0, 1)
+    add_edge_adj_mat(bit_matrix, 0, 2)
+    add_edge_adj_mat(bit_matrix, 1, 2)
+    display_adjacency_matrix(bit_matrix)
+    print(has_edge(bit_matrix, 0, 2))        # Output: True
+    print(bit_matrix.count_triangles())      # Output: 1
+
+    # Triangle counting: list-of-lists matrix scan vs bitset rows
+    VERTICES, DENSITY = 600, 0.05
+    edges = [(i, j) for i in range(VERTICES) for j in range(i + 1, VERTICES) if random.random() < DENSITY]
+
+    start = time.perf_counter()
+    matrix = create_adjacency_matrix(VERTICES)
+    for i, j in edges:
+        add_edge_adj_mat(matrix, i, j)
+    list_triangles = sum(1 for i, j in edges for k in range(j + 1, VERTICES) if matrix[i][k] and matrix[j][k])
+    list_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    bit_matrix = create_bit_matrix(VERTICES)
+    for i, j in edges:
+        bit_matrix.add_edge(i, j)
+    bit_triangles = bit_matrix.count_triangles()
+    bit_time = time.perf_counter() - start
+
+    print(f"triangles: {list_triangles} (lists, {list_time:.2f}s) vs {bit_triangles} (bitsets, {bit_time:.3f}s)")
@@ -0,0 +1,214 @@
+"""
+Compressed Sparse Row (CSR) is a compact representation of a graph using two flat arrays.
+
+An adjacency list built from Python lists stores every neighbor as a boxed Python int inside
+a Python list, which costs roughly 36+ bytes per edge endpoint. CSR stores the same information
+in two typed arrays:
+
+- offsets: length V + 1. The neighbors of vertex v are neighbors[offsets[v]:offsets[v + 1]]
+- neighbors: length 2E for an undirected graph (each edge is stored in both directions)
+- weights (optional): same length as neighbors, the weight of every stored edge endpoint
+
+With 32-bit integers this is 4 bytes per edge endpoint, about 9x smaller.
+
+    Adjacency list          CSR
+    0: [1, 2]               offsets   = [0, 2, 4, 6]
+    1: [0, 2]               neighbors = [1, 2, 0, 2, 0, 1]
+    2: [0, 1]
+
+The arrays are NumPy arrays when NumPy is installed and `array.array` otherwise.
+The graph is built in two passes over the edge list (count the degrees, then fill),
+using the same undirected semantics and neighbor order as `add_edge_adj_list`.
+
+`graph[v]` returns a view of v's neighbors without copying, and `len(graph)` is the number
+of vertices, so a CSRGraph can be passed directly to `bfs` and `dfs_disconnected`.
+
+Complexity:
+- Build: O(V + E)
+- Neighbors of v: O(1) to get the view, O(degree(v)) to iterate it
+- Space: O(V + E) machine integers
+"""
+
+from array import array
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError: # NumPy is optional
+    np = None
+
+INT32_MAX = 2 ** 31 - 1
+
+
+class CSRGraph:
+    """
+    A read-only graph stored as an offsets array plus a neighbors array.
+    Build it with `from_edges` or `from_adjacency_list`.
+    """
+    def __init__(self, offsets, neighbors, weights=None):
+        self.offsets = offsets
+        self.neighbors = neighbors
+        self.weights = weights
+        self.num_vertices = len(offsets) - 1
+        # Slicing a memoryview (or a NumPy array) gives a view instead of a copy
+        self._neighbors_view = self._view(neighbors)
+        self._weights_view = self._view(weights) if weights is not None else None
+
+    @staticmethod
+    def _view(values):
+        """A zero-copy sliceable view of an array"""
+        return values if np is not None and isinstance(values, np.ndarray) else memoryview(values)
+
+    @staticmethod
+    def _typecodes(num_vertices: int, num_entries: int) -> Tuple[str, str]:
+        """Pick 32-bit integers when they are wide enough, 64-bit otherwise"""
+        vertex_code = 'i' if num_vertices <= INT32_MAX else 'q'
+        offset_code = 'i' if num_entries <= INT32_MAX else 'q'
+        return offset_code, vertex_code
+
+    @classmethod
+    def from_edges(cls, num_vertices: int, edges: Iterable[Tuple[int, int]],
+                   directed: bool = False, weights: Optional[Sequence[float]] = None) -> "CSRGraph":
+        """
+        Build a CSR graph from (i, j) edges, optionally with one weight per edge.
+        Undirected edges are stored in both directions, exactly like `add_edge_adj_list`,
+        and every vertex keeps its neighbors in the order the edges were given.
+        The edges are read twice, so a one-shot iterator is first collected into a list.
+        """
+        if not isinstance(edges, Sequence) and not (np is not None and isinstance(edges, np.ndarray)):
+            edges = list(edges)
+        if weights is not None and len(weights) != len(edges):
+            raise ValueError("weights must have one entry per edge")
+
+        if np is not None:
+            return cls._from_edges_numpy(num_vertices, edges, directed, weights)
+
+        num_entries = len(edges) if directed else 2 * len(edges)
+        offset_code, vertex_code = cls._typecodes(num_vertices, num_entries)
+
+        # Pass 1: count the degree of every vertex
+        degrees = array(offset_code, bytes(array(offset_code).itemsize * (num_vertices + 1)))
+        for i, j in edges:
+            degrees[i + 1] += 1
+            if not directed:
+                degrees[j + 1] += 1
+
+        # Prefix sums turn degrees into offsets
+        offsets = degrees
+        for vertex in range(num_vertices):
+            offsets[vertex + 1] += offsets[vertex]
+
+        # Pass 2: write every neighbor (and weight) at its vertex's cursor
+        neighbors = array(vertex_code, bytes(array(vertex_code).itemsize * num_entries))
+        edge_weights = array('d', bytes(8 * num_entries)) if weights is not None else None
+        cursor = offsets[:-1]
+        for edge, (i, j) in enumerate(edges):
+            if edge_weights is not None:
+                edge_weights[cursor[i]] = weights[edge]
+            neighbors[cursor[i]] = j
+            cursor[i] += 1
+            if not directed:
+                if edge_weights is not None:
+                    edge_weights[cursor[j]] = weights[edge]
+                neighbors[cursor[j]] = i
+                cursor[j] += 1
+
+        return cls(offsets, neighbors, edge_weights)
+
+    @classmethod
+    def _from_edges_numpy(cls, num_vertices: int, edges, directed: bool, weights) -> "CSRGraph":
+        """Vectorized version of from_edges"""
+        pairs = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+        edge_weights = np.asarray(weights, dtype=np.float64) if weights is not None else None
+        if directed:
+            sources, targets = pairs[:, 0], pairs[:, 1]
+        else:
+            # Interleave (i, j) and (j, i) so a stable sort keeps the add_edge_adj_list order
+            sources = np.stack((pairs[:, 0], pairs[:, 1]), axis=1).ravel()
+            targets = np.stack((pairs[:, 1], pairs[:, 0]), axis=1).ravel()
+            if edge_weights is not None:
+                edge_weights = np.repeat(edge_weights, 2)
+
+        offset_code, vertex_code = cls._typecodes(num_vertices, len(sources))
+        offsets = np.zeros(num_vertices + 1, dtype=np.int32 if offset_code == 'i' else np.int64)
+        offsets[1:] = np.cumsum(np.bincount(sources, minlength=num_vertices))
+
+        order = np.argsort(sources, kind='stable')
+        neighbors = targets[order].astype(np.int32 if vertex_code == 'i' else np.int64)
+        return cls(offsets, neighbors, edge_weights[order] if edge_weights is not None else None)
+
+    @classmethod
+    def from_adjacency_list(cls, adj_list: List[List[int]]) -> "CSRGraph":
+        """Convert an adjacency list (as built by `create_adjacency_list`) into CSR form"""
+        num_entries = sum(len(edges) for edges in adj_list)
+        offset_code, vertex_code = cls._typecodes(len(adj_list), num_entries)
+
+        offsets = array(offset_code, [0])
+        neighbors = array(vertex_code)
+        for edges in adj_list:
+            neighbors.extend(edges)
+            offsets.append(len(neighbors))
+
+        if np is not None:
+            return cls(np.frombuffer(offsets, dtype=offsets.typecode),
+                       np.frombuffer(neighbors, dtype=neighbors.typecode))
+        return cls(offsets, neighbors)
+
+    def __len__(self):
+        """Number of vertices, so `bfs` can size its visited array"""
+        return self.num_vertices
+
+    def __getitem__(self, vertex: int):
+        """Neighbors of the vertex, as a view into the neighbors array"""
+        return self._neighbors_view[self.offsets[vertex]:self.offsets[vertex + 1]]
+
+    def weighted_neighbors(self, vertex: int) -> Iterator[Tuple[int, float]]:
+        """(neighbor, weight) pairs of the vertex, read from the views without copying"""
+        start, end = self.offsets[vertex], self.offsets[vertex + 1]
+        return zip(self._neighbors_view[start:end], self._weights_view[start:end])
+
+    def degree(self, vertex: int) -> int:
+        """Number of neighbors of the vertex"""
+        return int(self.offsets[vertex + 1] - self.offsets[vertex])
+
+    @property
+    def num_entries(self) -> int:
+        """Number of stored edge endpoints (2E for an undirected graph)"""
+        return len(self.neighbors)
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes used by the offsets, neighbors and weights arrays"""
+        return sum(len(arr) * arr.itemsize for arr in (self.offsets, self.neighbors, self.weights)
+                   if arr is not None)
+
+    def to_adjacency_list(self) -> List[List[int]]:
+        """Convert back to a list-of-lists adjacency list"""
+        return [[int(neighbor) for neighbor in self[vertex]] for vertex in range(self.num_vertices)]
+
+    def __repr__(self):
+        return f"CSRGraph(vertices={self.num_vertices}, entries={self.num_entries})"
+
+
+if __name__ == '__main__':
+    import random
+    import sys
+
+    from algorithms.bfs import bfs, dfs_disconnected
+
+    # The same 6-vertex graph as in graph.py, with two components
+    csr = CSRGraph.from_edges(6, [(0, 1), (0, 2), (3, 4), (4, 5)])
+    print(csr.to_adjacency_list())  # Output: [[1, 2], [0], [0], [4], [3, 5], [4]]
+    print(bfs(csr, 0))              # Output: [0, 1, 2]
+    print(dfs_disconnected(csr))    # Output: [0, 1, 2, 3, 4, 5]
+
+    # Memory of a random graph: list of lists vs CSR
+    VERTICES, EDGES = 100_000, 500_000
+    edge_list = [(random.randrange(VERTICES), random.randrange(VERTICES)) for _ in range(EDGES)]
+    adj_list = [[] for _ in range(VERTICES)]
+    for u, v in edge_list:
+        adj_list[u].append(v)
+        adj_list[v].append(u)
+    list_bytes = sys.getsizeof(adj_list) + sum(sys.getsizeof(edges) for edges in adj_list) \
+        + 28 * 2 * EDGES # One boxed int per endpoint (small ints are shared, so this is an upper bound)
+    print(f"adjacency list: ~{list_bytes / 2 ** 20:.1f} MB, CSR: {CSRGraph.from_edges(VERTICES, edge_list).nbytes / 2 ** 20:.1f} MB")
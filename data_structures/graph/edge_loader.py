@@ -0,0 +1,310 @@
+"""
+A streaming loader that builds a CSRGraph straight from an edge-list file.
+
+Calling `add_edge_adj_list` once per edge from Python is slow for large files, and reading
+all the edges into a list first keeps a second copy of the graph in memory. This loader
+reads the file in chunks and builds the CSR arrays in two passes:
+
+1. Count pass: stream the edges and count the degree of every vertex.
+   Prefix sums of the degrees give the offsets array.
+2. Fill pass: stream the edges again and write every neighbor at its vertex's cursor.
+
+Only one chunk of edges is held in memory at a time, on top of the final offsets and
+neighbors arrays, so the extra memory is bounded by the chunk size.
+
+Two file formats are supported:
+- Text: one edge per line, "u v" separated by whitespace. Lines starting with '#' or '%' are comments.
+- Binary: consecutive pairs of little-endian integers (int32 by default, int64 with typecode='q').
+  The binary file is memory-mapped. With NumPy every chunk is a zero-copy view of the mapping,
+  without it one chunk at a time is copied into an array.
+
+The resulting graph has the same undirected semantics and neighbor order as `add_edge_adj_list`.
+Every load also reports edges/sec and, optionally, the peak memory allocated while loading.
+
+Complexity:
+- Time: O(V + E), reading the file twice
+- Extra space: O(chunk size) beyond the O(V + E) CSR arrays
+"""
+
+import mmap
+import os
+import sys
+import time
+import tracemalloc
+from array import array
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from data_structures.graph.csr_graph import CSRGraph
+
+try:
+    import numpy as np
+except ImportError: # NumPy is optional
+    np = None
+
+COMMENT_PREFIXES = ('#', '%')
+
+
+def _text_chunks(path: str, chunk_bytes: int) -> Iterator[array]:
+    """Yield flat [u0, v0, u1, v1, ...] integer arrays of roughly chunk_bytes of text each"""
+    with open(path, 'r') as file:
+        while True:
+            lines = file.readlines(chunk_bytes) # Complete lines only
+            if not lines:
+                return
+            text = ''.join(line for line in lines if not line.startswith(COMMENT_PREFIXES))
+            if np is not None:
+                yield np.array(text.split(), dtype=np.int64)
+            else:
+                yield array('q', map(int, text.split()))
+
+
+def _binary_chunks(path: str, chunk_bytes: int, typecode: str) -> Iterator[Any]:
+    """Yield flat integer views of a memory-mapped binary edge file, chunk_bytes at a time"""
+    item_size = array(typecode).itemsize
+    pair_size = 2 * item_size
+    chunk_bytes = max(chunk_bytes - chunk_bytes % pair_size, pair_size)
+
+    if np is not None:
+        # np.memmap stays open while chunk views still reference it, and closes once they are gone
+        if os.path.getsize(path) < pair_size:
+            return
+        mapped = np.memmap(path, dtype='<' + typecode, mode='r')
+        items_per_chunk = chunk_bytes // item_size
+        size = len(mapped) - len(mapped) % 2
+        for start in range(0, size, items_per_chunk):
+            yield mapped[start:min(start + items_per_chunk, size)]
+        return
+
+    with open(path, 'rb') as file:
+        try:
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError: # An empty file cannot be mapped
+            return
+        with mapped:
+            size = len(mapped) - len(mapped) % pair_size
+            for start in range(0, size, chunk_bytes):
+                chunk = array(typecode) # The pure-Python path copies one chunk at a time
+                with memoryview(mapped)[start:min(start + chunk_bytes, size)] as window:
+                    chunk.frombytes(window)
+                if sys.byteorder == 'big':
+                    chunk.byteswap()
+                yield chunk
+
+
+def _check_non_negative(smallest: int):
+    """Reject negative vertex ids, which would otherwise index from the end of the arrays"""
+    if smallest < 0:
+        raise ValueError(f"Invalid value of vertex {smallest}: vertex ids must be non-negative")
+
+
+def _build_csr(chunks: Callable[[], Iterable[Any]], num_vertices: Optional[int], directed: bool) -> Tuple[CSRGraph, int]:
+    """Run the count pass and the fill pass over the chunks. Returns the graph and the edge count."""
+    if np is not None:
+        return _build_csr_numpy(chunks, num_vertices, directed)
+
+    # Pass 1: degrees (the array grows if num_vertices is unknown)
+    degrees = array('q', bytes(8 * (num_vertices or 0)))
+    num_edges = 0
+    for chunk in chunks():
+        sources, targets = chunk[0::2], chunk[1::2]
+        num_edges += len(sources)
+        _check_non_negative(min(chunk, default=0))
+        largest = max(max(sources, default=-1), max(targets, default=-1))
+        if largest >= len(degrees):
+            if num_vertices is not None:
+                raise ValueError(f"Vertex {largest} is out of range for {num_vertices} vertices")
+            degrees.extend(array('q', bytes(8 * (largest + 1 - len(degrees)))))
+        for i, j in zip(sources, targets):
+            degrees[i] += 1
+            if not directed:
+                degrees[j] += 1
+
+    vertex_count = len(degrees)
+    num_entries = num_edges if directed else 2 * num_edges
+    offset_code, vertex_code = CSRGraph._typecodes(vertex_count, num_entries)
+
+    offsets = array(offset_code, [0]) * (vertex_count + 1)
+    for vertex in range(vertex_count):
+        offsets[vertex + 1] = offsets[vertex] + degrees[vertex]
+    del degrees
+
+    # Pass 2: fill the neighbors at each vertex's cursor
+    neighbors = array(vertex_code, bytes(array(vertex_code).itemsize * num_entries))
+    cursor = offsets[:-1]
+    for chunk in chunks():
+        _check_non_negative(min(chunk, default=0)) # The file may have changed since the first pass
+        for i, j in zip(chunk[0::2], chunk[1::2]):
+            neighbors[cursor[i]] = j
+            cursor[i] += 1
+            if not directed:
+                neighbors[cursor[j]] = i
+                cursor[j] += 1
+
+    return CSRGraph(offsets, neighbors), num_edges
+
+
+def _build_csr_numpy(chunks: Callable[[], Iterable[Any]], num_vertices: Optional[int], directed: bool) -> Tuple[CSRGraph, int]:
+    """Vectorized count and fill passes"""
+    def endpoints(chunk):
+        pairs = np.asarray(chunk, dtype=np.int64).reshape(-1, 2)
+        if directed:
+            return pairs[:, 0], pairs[:, 1]
+        # Interleave (i, j) and (j, i) to keep the add_edge_adj_list order
+        return pairs.ravel(), pairs[:, ::-1].ravel()
+
+    # Pass 1: degrees
+    degrees = np.zeros(num_vertices or 0, dtype=np.int64)
+    num_edges = 0
+    for chunk in chunks():
+        # Undirected edges count both endpoints, so the flat chunk itself is the list of sources
+        sources = endpoints(chunk)[0] if directed else np.asarray(chunk, dtype=np.int64)
+        num_edges += len(chunk) // 2
+        if not len(sources):
+            continue
+        _check_non_negative(int(sources.min()))
+        counts = np.bincount(sources)
+        if len(counts) > len(degrees):
+            if num_vertices is not None:
+                raise ValueError(f"Vertex {len(counts) - 1} is out of range for {num_vertices} vertices")
+            degrees = np.concatenate((degrees, np.zeros(len(counts) - len(degrees), dtype=np.int64)))
+        degrees[:len(counts)] += counts
+
+    vertex_count = len(degrees)
+    num_entries = num_edges if directed else 2 * num_edges
+    offset_code, vertex_code = CSRGraph._typecodes(vertex_count, num_entries)
+    offsets = np.zeros(vertex_count + 1, dtype=np.int32 if offset_code == 'i' else np.int64)
+    offsets[1:] = np.cumsum(degrees)
+    del degrees
+
+    # Pass 2: within a chunk, entries of the same source go to consecutive cursor positions
+    neighbors = np.empty(num_entries, dtype=np.int32 if vertex_code == 'i' else np.int64)
+    cursor = offsets[:-1].astype(np.int64)
+    for chunk in chunks():
+        sources, targets = endpoints(chunk)
+        if not len(sources):
+            continue
+        _check_non_negative(min(int(sources.min()), int(targets.min())))
+        order = np.argsort(sources, kind='stable')
+        sorted_sources = sources[order]
+        group_start = np.searchsorted(sorted_sources, sorted_sources, side='left')
+        positions = cursor[sorted_sources] + (np.arange(len(sorted_sources)) - group_start)
+        neighbors[positions] = targets[order]
+        cursor += np.bincount(sources, minlength=vertex_count)
+
+    return CSRGraph(offsets, neighbors), num_edges
+
+
+def load_edge_list(path: str, num_vertices: Optional[int] = None, binary: bool = False,
+                   typecode: str = 'i', directed: bool = False, chunk_bytes: int = 1 << 20,
+                   trace_memory: bool = False) -> Tuple[CSRGraph, Dict[str, Any]]:
+    """
+    Build a CSRGraph from an edge-list file in two streaming passes.
+
+    Args:
+      path (str): The edge-list file.
+      num_vertices (Optional[int]): Number of vertices. If omitted, the largest vertex id + 1.
+      binary (bool): Read pairs of little-endian integers instead of text lines.
+      typecode (str): Integer type of the binary format, 'i' (int32) or 'q' (int64).
+      directed (bool): Store each edge only from its first to its second vertex.
+      chunk_bytes (int): How much of the file is processed at once.
+      trace_memory (bool): Measure the peak memory allocated during the load with tracemalloc
+        (this slows the load down noticeably).
+    Returns:
+      Tuple[CSRGraph, Dict[str, Any]]: The graph and a report with the number of edges,
+      the elapsed seconds, edges per second and the peak traced memory in bytes (or None).
+    """
+    if binary:
+        chunks = lambda: _binary_chunks(path, chunk_bytes, typecode)
+    else:
+        chunks = lambda: _text_chunks(path, chunk_bytes)
+
+    if trace_memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    graph, num_edges = _build_csr(chunks, num_vertices, directed)
+    elapsed = time.perf_counter() - start
+    peak_memory = None
+    if trace_memory:
+        _, peak_memory = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    report = {
+        "edges": num_edges,
+        "seconds": elapsed,
+        "edges_per_sec": num_edges / elapsed if elapsed else 0.0,
+        "peak_memory_bytes": peak_memory,
+    }
+    return graph, report
+
+
+def _checked_edges(edges: Iterable[Tuple[int, int]]) -> Iterator[Tuple[int, int]]:
+    """Pass the edges through, rejecting negative vertex ids"""
+    for i, j in edges:
+        if i < 0 or j < 0:
+            raise ValueError(f"Invalid value of edge ({i}, {j}): vertex ids must be non-negative")
+        yield i, j
+
+
+def write_edge_list(path: str, edges: Iterable[Tuple[int, int]], binary: bool = False, typecode: str = 'i'):
+    """
+    Write edges as a text edge list or as pairs of little-endian integers.
+    The edges are consumed once, so any iterable (including a generator) can be written.
+    """
+    if not binary:
+        with open(path, 'w') as file:
+            file.writelines(f"{i} {j}\n" for i, j in _checked_edges(edges))
+        return
+
+    with open(path, 'wb') as file:
+        buffer = array(typecode)
+        for i, j in _checked_edges(edges):
+            try:
+                buffer.append(i)
+                buffer.append(j)
+            except OverflowError:
+                raise ValueError(f"Vertex ids of edge ({i}, {j}) do not fit in typecode "
+                                 f"'{typecode}', use typecode='q'") from None
+            if len(buffer) >= 1 << 20:
+                if sys.byteorder == 'big':
+                    buffer.byteswap()
+                buffer.tofile(file)
+                buffer = array(typecode)
+        if sys.byteorder == 'big':
+            buffer.byteswap()
+        buffer.tofile(file)
+
+
+if __name__ == '__main__':
+    import tempfile
+
+    from data_structures.graph.generators import edges_to_adjacency_list, power_law_edges
+
+    VERTICES = 50_000
+    edge_list: List[Tuple[int, int]] = power_law_edges(VERTICES)
+
+    with tempfile.TemporaryDirectory() as directory:
+        text_path = os.path.join(directory, 'edges.txt')
+        binary_path = os.path.join(directory, 'edges.bin')
+        write_edge_list(text_path, edge_list)
+        write_edge_list(binary_path, edge_list, binary=True)
+
+        for label, binary in (("text", False), ("binary", True)):
+            path = binary_path if binary else text_path
+            graph, report = load_edge_list(path, binary=binary)
+            _, traced = load_edge_list(path, binary=binary, trace_memory=True) # Separate run, tracing is slow
+            print(f"{label:>6}: {report['edges']:,} edges, {report['edges_per_sec']:,.0f} edges/s, "
+                  f"peak {traced['peak_memory_bytes'] / 2 ** 20:.1f} MB, CSR {graph.nbytes / 2 ** 20:.1f} MB")
+
+        # Same neighbors, in the same order, as add_edge_adj_list
+        small = edge_list[:1000]
+        write_edge_list(text_path, small)
+        graph, _ = load_edge_list(text_path, num_vertices=VERTICES)
+        print(graph.to_adjacency_list() == edges_to_adjacency_list(VERTICES, small))  # Output: True
+
+        # Negative vertex ids are rejected instead of wrapping around to the last vertices
+        with open(text_path, 'w') as file:
+            file.write("0 1\n-1 2\n")
+        try:
+            load_edge_list(text_path)
+        except ValueError as error:
+            print(error)  # Output: Invalid value of vertex -1: vertex ids must be non-negative
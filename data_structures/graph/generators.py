@@ -0,0 +1,69 @@
+"""
+Synthetic graph generators used by the graph benchmarks.
+
+Real graphs roughly fall into two families, and algorithms behave very differently on each:
+
+1. Road-like graphs: every vertex has a handful of neighbors and the diameter is large.
+   `grid_edges` builds a 2D grid, a common stand-in for a road network.
+
+2. Power-law (scale-free) graphs: a few hubs have huge degrees and most vertices few,
+   and the diameter is small. Social networks and the web look like this.
+   `power_law_edges` uses preferential attachment (the Barabasi-Albert model):
+   each new vertex connects to `m` existing vertices chosen with probability proportional to their degree.
+
+All generators return an edge list of (i, j) pairs that can be fed to `add_edge_adj_list`,
+`CSRGraph.from_edges` or `add_edge_weighted_adj_list`.
+"""
+
+import random
+from typing import List, Tuple
+
+from data_structures.graph.graph import add_edge_adj_list, create_adjacency_list
+
+
+def grid_edges(rows: int, cols: int) -> List[Tuple[int, int]]:
+    """Edges of a rows x cols grid, vertex (r, c) being numbered r * cols + c"""
+    edges = []
+    for r in range(rows):
+        for c in range(cols):
+            vertex = r * cols + c
+            if c + 1 < cols:
+                edges.append((vertex, vertex + 1))
+            if r + 1 < rows:
+                edges.append((vertex, vertex + cols))
+    return edges
+
+
+def power_law_edges(num_vertices: int, m: int = 4, seed: int = 0) -> List[Tuple[int, int]]:
+    """
+    Edges of a Barabasi-Albert preferential attachment graph.
+    Sampling a uniform entry of the list of edge endpoints picks a vertex proportionally to its degree.
+    """
+    rng = random.Random(seed)
+    edges = []
+    endpoints = list(range(m)) # Start with m vertices that can be attached to
+
+    for vertex in range(m, num_vertices):
+        targets = set()
+        while len(targets) < m:
+            targets.add(rng.choice(endpoints))
+        for target in targets:
+            edges.append((vertex, target))
+            endpoints.append(vertex)
+            endpoints.append(target)
+
+    return edges
+
+
+def random_weights(num_edges: int, low: int = 1, high: int = 10, seed: int = 0) -> List[int]:
+    """Uniform integer weights in [low, high], one per edge"""
+    rng = random.Random(seed)
+    return [rng.randint(low, high) for _ in range(num_edges)]
+
+
+def edges_to_adjacency_list(num_vertices: int, edges: List[Tuple[int, int]]) -> List[List[int]]:
+    """Build an undirected adjacency list from an edge list"""
+    adj_list = create_adjacency_list(num_vertices)
+    for i, j in edges:
+        add_edge_adj_list(adj_list, i, j)
+    return adj_list
@@ -65,11 +65,20 @@ def add_edge_adj_mat(adj_matrix, i, j, weight=1):
     adj_matrix[i][j] = weight
     adj_matrix[j][i] = weight  # For undirected graph
 
+def has_edge(adj_matrix, i, j):
+    """Check whether there is an edge from i to j in the adjacency matrix."""
+    return adj_matrix[i][j] != 0
+
 def add_edge_adj_list(adj_list, i, j):
     """Add an edge to the adjacency list"""
     adj_list[i].append(j)
     adj_list[j].append(i)  # For undirected graph
 
+def add_edge_weighted_adj_list(adj_list, i, j, weight):
+    """Add a weighted edge to the adjacency list as (neighbor, weight) pairs"""
+    adj_list[i].append((j, weight))
+    adj_list[j].append((i, weight))  # For undirected graph
+
 def display_adjacency_matrix(adj_matrix):
     """Display the adjacency matrix."""
     for row in adj_matrix:
@@ -0,0 +1,177 @@
+"""
+A Versioned Graph wraps an adjacency list or adjacency matrix and memoizes traversal results
+between mutations.
+
+Read-heavy workloads run the same `bfs(graph, start)` over and over while the graph rarely changes.
+The wrapper keeps a version counter that every mutation (`add_edge_adj_list`, `add_edge_adj_mat`,
+`add_vertex`) increments, and caches results in an LRUCache under the key
+
+    (algorithm, source, version)
+
+A result is therefore reused only while the graph is exactly the one it was computed on.
+When the version changes, the keys of the previous version can never match again, so they are
+deleted from the cache right away instead of waiting to be evicted.
+
+Cached traversals:
+- bfs(start): visit order, like `bfs` in algorithms/bfs.py
+- distances(start): BFS level of every vertex, like `bfs_levels`
+- components(): component labels and sizes, like `connected_components`
+
+Results are returned as tuples, so a caller cannot modify the shared cached copy by accident.
+`graph[v]` returns the neighbors of v for both representations, so the wrapper can also be passed
+directly to any traversal in algorithms/. Mutations made to the underlying structure without going
+through the wrapper are not seen: call `touch()` after them.
+
+Complexity:
+- Cached query: O(1) on a hit, the cost of the traversal on a miss
+- Mutation: O(1) for the edge, plus O(entries of the old version) for the invalidation
+"""
+
+from typing import Any, Callable, Dict, List, Set, Tuple
+
+from algorithms.bfs import bfs, bfs_levels
+from algorithms.connected_components import adjacency_edges, connected_components
+from data_structures.graph.graph import add_edge_adj_list, add_edge_adj_mat
+from data_structures.hashing.caching.LRU.lru import MISSING, LRUCache
+
+
+class VersionedGraph:
+    """
+    An adjacency list or matrix with a mutation version and a bounded cache of traversal results.
+
+    Args:
+      graph (List[List]): An adjacency list (`create_adjacency_list`) or, with matrix=True,
+        an adjacency matrix (`create_adjacency_matrix`). It is wrapped, not copied.
+      matrix (bool): Whether `graph` is an adjacency matrix.
+      cache_size (int): Maximum number of cached results.
+    """
+    def __init__(self, graph: List[List], matrix: bool = False, cache_size: int = 128):
+        if cache_size <= 0:
+            raise ValueError("Invalid value of cache_size")
+        self.graph = graph
+        self.matrix = matrix
+        self.version = 0
+        self.invalidations = 0 # Cached results dropped because the graph changed
+        # Keys cached for the current version; evicted keys leave the set so it stays bounded
+        self._version_keys: Set[Tuple[str, Any, int]] = set()
+        self.cache = LRUCache(cache_size, record_stats=True,
+                              on_evict=lambda key, _: self._version_keys.discard(key))
+
+    def __len__(self):
+        return len(self.graph)
+
+    def __getitem__(self, vertex: int) -> List[int]:
+        """Neighbors of the vertex, for both representations"""
+        if self.matrix:
+            return [column for column, weight in enumerate(self.graph[vertex]) if weight]
+        return self.graph[vertex]
+
+    def touch(self):
+        """Start a new version and drop every result cached for the previous one"""
+        self.version += 1
+        if self._version_keys:
+            self.invalidations += self.cache.delete_many(self._version_keys)
+            self._version_keys = set()
+
+    def add_edge_adj_list(self, i: int, j: int):
+        """Add an undirected edge to the adjacency list"""
+        if self.matrix:
+            raise ValueError("Invalid value of matrix: the wrapped graph is an adjacency matrix")
+        add_edge_adj_list(self.graph, i, j)
+        self.touch()
+
+    def add_edge_adj_mat(self, i: int, j: int, weight: int = 1):
+        """Add an undirected edge to the adjacency matrix"""
+        if not self.matrix:
+            raise ValueError("Invalid value of matrix: the wrapped graph is an adjacency list")
+        add_edge_adj_mat(self.graph, i, j, weight)
+        self.touch()
+
+    def add_vertex(self) -> int:
+        """Add an isolated vertex and return its id"""
+        if self.matrix:
+            for row in self.graph:
+                row.append(0)
+            self.graph.append([0] * (len(self.graph) + 1))
+        else:
+            self.graph.append([])
+        self.touch()
+        return len(self.graph) - 1
+
+    def cached(self, algorithm: str, source: Any, compute: Callable[[], Any]) -> Any:
+        """
+        Return the result stored under (algorithm, source, version), computing and storing it on a miss.
+        """
+        key = (algorithm, source, self.version)
+        result = self.cache.get(key, MISSING)
+        if result is MISSING:
+            result = compute()
+            self.cache.put(key, result)
+            self._version_keys.add(key)
+        return result
+
+    def _check(self, vertex: int):
+        if not 0 <= vertex < len(self.graph):
+            raise ValueError("Invalid value of start")
+
+    def bfs(self, start: int = 0) -> Tuple[int, ...]:
+        """Vertices reachable from start, in BFS visit order"""
+        self._check(start)
+        return self.cached("bfs", start, lambda: tuple(bfs(self, start)))
+
+    def distances(self, start: int = 0) -> Tuple[int, ...]:
+        """BFS level of every vertex from start, -1 for unreachable vertices"""
+        self._check(start)
+        return self.cached("distances", start, lambda: tuple(bfs_levels(self, start)))
+
+    def components(self) -> Tuple[Tuple[int, ...], Tuple[int, ...]]:
+        """Component label of every vertex and size of every component"""
+        def compute():
+            labels, sizes = connected_components(len(self.graph), adjacency_edges(self))
+            return tuple(labels), tuple(sizes)
+        return self.cached("components", None, compute)
+
+    def cache_stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and hit ratio of the result cache, with the version and invalidations"""
+        stats = self.cache.stats.as_dict()
+        stats["version"] = self.version
+        stats["invalidations"] = self.invalidations
+        stats["cached_results"] = len(self.cache.cache)
+        return stats
+
+
+if __name__ == '__main__':
+    import random
+    import time
+
+    from data_structures.graph.generators import edges_to_adjacency_list, power_law_edges
+    from data_structures.graph.graph import create_adjacency_list, create_adjacency_matrix
+
+    versioned = VersionedGraph(create_adjacency_list(4))
+    versioned.add_edge_adj_list(0, 1)
+    print(versioned.bfs(0))         # Output: (0, 1)
+    print(versioned.bfs(0))         # Output: (0, 1) (cache hit)
+    versioned.add_edge_adj_list(1, 2)
+    print(versioned.bfs(0))         # Output: (0, 1, 2) (new version, recomputed)
+    print(versioned.components())   # Output: ((0, 0, 0, 1), (3, 1))
+    stats = versioned.cache_stats()
+    print(stats["hits"], stats["misses"], stats["version"], stats["invalidations"])  # Output: 1 3 2 1
+
+    matrix = VersionedGraph(create_adjacency_matrix(3), matrix=True)
+    matrix.add_edge_adj_mat(0, 2)
+    print(matrix.distances(0))      # Output: (0, -1, 1)
+
+    # Read-heavy workload: many repeated queries, rare mutations
+    VERTICES = 20_000
+    workload = VersionedGraph(edges_to_adjacency_list(VERTICES, power_law_edges(VERTICES)), cache_size=64)
+    rng = random.Random(0)
+    hot_sources = [rng.randrange(VERTICES) for _ in range(16)]
+    start = time.perf_counter()
+    for query in range(2_000):
+        if query % 500 == 499:
+            workload.add_edge_adj_list(rng.randrange(VERTICES), rng.randrange(VERTICES))
+        workload.distances(rng.choice(hot_sources))
+    elapsed = time.perf_counter() - start
+    stats = workload.cache_stats()
+    print(f"2,000 queries in {elapsed:.2f}s, hit ratio {stats['hit_ratio']:.1%}, "
+          f"{stats['invalidations']} results invalidated over {stats['version']} versions")
@@ -0,0 +1,169 @@
+"""
+An Array-backed LRU Cache keeps the recency list in preallocated parallel arrays instead of Node objects.
+
+The classic LRUCache allocates one Node per entry, and each Node is a full Python object
+with its own `__dict__` holding key, data, prev and next. At tens of millions of entries
+that per-object overhead dominates memory usage and garbage collection time.
+
+This implementation preallocates fixed-capacity storage once:
+- `keys` and `values`: Python lists holding the key and value stored in each slot
+- `prev` and `next`: typed `array` objects holding slot indices instead of object pointers
+- `index`: a dictionary mapping each key to its slot
+
+Slot `capacity` is a sentinel that plays the role of both the dummy head and the dummy tail,
+so the list is circular: `next[sentinel]` is the most recently used slot and
+`prev[sentinel]` is the least recently used one.
+
+Slots are filled in order until the cache is full. After that, an insert reuses the slot
+of the evicted entry, and an update overwrites the value in place, so `put` never allocates
+a node. The prev/next arrays are plain machine integers and are not tracked by the garbage collector.
+
+Complexity:
+- get/put: O(1)
+- Space: O(capacity), allocated once up front
+
+Run the comparison from the repository root:
+    python -m data_structures.hashing.caching.LRU.array_lru
+"""
+
+import gc
+import random
+import time
+import tracemalloc
+from array import array
+from typing import Any
+
+from data_structures.hashing.caching.LRU.lru import LRUCache
+
+
+class ArrayLRUCache:
+    """
+    A Least Recently Used (LRU) Cache with the same get/put API as LRUCache,
+    built on parallel arrays of slot indices instead of linked Node objects.
+    """
+    def __init__(self, capacity: int):
+        if capacity <= 0:
+            raise ValueError("Invalid value of capacity")
+
+        self.capacity = capacity
+        self.index = {} # Dictionary to store key and slot mapping
+        self.keys = [None] * capacity
+        self.values = [None] * capacity
+        self.size = 0 # Number of slots in use (slots 0..size-1)
+
+        # Slot `capacity` is the sentinel; it starts out linked to itself
+        self.sentinel = capacity
+        typecode = 'i' if capacity < 2 ** 31 - 1 else 'q'
+        self.prev = array(typecode, [self.sentinel]) * (capacity + 1)
+        self.next = array(typecode, [self.sentinel]) * (capacity + 1)
+
+    def _del_slot(self, slot: int):
+        """Unlink a slot from the recency list"""
+        prev_slot = self.prev[slot]
+        next_slot = self.next[slot]
+        self.next[prev_slot] = next_slot
+        self.prev[next_slot] = prev_slot
+
+    def _add_slot(self, slot: int):
+        """Link a slot right after the sentinel (most recently used position)"""
+        first = self.next[self.sentinel]
+        self.next[self.sentinel] = slot
+        self.prev[slot] = self.sentinel
+        self.next[slot] = first
+        self.prev[first] = slot
+
+    def get(self, key: Any) -> Any:
+        """Get the value of the key if it exists in the cache, otherwise return -1"""
+        slot = self.index.get(key)
+        if slot is None:
+            return -1
+
+        # Move the accessed slot to the front, unless it is already there
+        if self.next[self.sentinel] != slot:
+            self._del_slot(slot)
+            self._add_slot(slot)
+
+        return self.values[slot]
+
+    def put(self, key: Any, value: Any) -> None:
+        """Insert or update the value of the key in the cache"""
+        slot = self.index.get(key)
+
+        # If the key already exists, update the value in place and move it to the front
+        if slot is not None:
+            self.values[slot] = value
+            if self.next[self.sentinel] != slot:
+                self._del_slot(slot)
+                self._add_slot(slot)
+            return
+
+        if self.size < self.capacity:
+            # Take the next slot that has never been used
+            slot = self.size
+            self.size += 1
+        else:
+            # Reuse the slot of the least recently used entry
+            slot = self.prev[self.sentinel]
+            self._del_slot(slot)
+            del self.index[self.keys[slot]]
+
+        self.keys[slot] = key
+        self.values[slot] = value
+        self.index[key] = slot
+        self._add_slot(slot)
+
+    def __len__(self):
+        return self.size
+
+    def __repr__(self):
+        """String representation of the cache for debugging"""
+        items = []
+        slot = self.next[self.sentinel]
+        while slot != self.sentinel:
+            items.append(f"{self.keys[slot]}: {self.values[slot]}")
+            slot = self.next[slot]
+        return "ArrayLRUCache([" + ", ".join(items) + "])"
+
+
+def benchmark(capacity: int = 200_000, num_ops: int = 1_000_000):
+    """
+    Compare memory and ops/sec of the Node-based LRUCache and ArrayLRUCache.
+    Memory is the traced allocation after filling the cache to capacity.
+    Throughput is measured on a mix of 80% gets and 20% puts over twice the capacity in keys.
+    """
+    keys = [random.randrange(2 * capacity) for _ in range(num_ops)]
+    reads = [random.random() < 0.8 for _ in range(num_ops)]
+
+    print(f"{'cache':>14} | {'memory (MB)':>11} | {'ops/s':>12}")
+    for cache_class in (LRUCache, ArrayLRUCache):
+        gc.collect()
+        tracemalloc.start()
+        cache = cache_class(capacity)
+        for key in range(capacity):
+            cache.put(key, key)
+        memory, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        start = time.perf_counter()
+        for key, is_read in zip(keys, reads):
+            if is_read:
+                cache.get(key)
+            else:
+                cache.put(key, key)
+        elapsed = time.perf_counter() - start
+
+        print(f"{cache_class.__name__:>14} | {memory / 2 ** 20:>11.1f} | {num_ops / elapsed:>12,.0f}")
+
+
+# Example usage
+if __name__ == "__main__":
+    array_cache = ArrayLRUCache(2)
+    array_cache.put(1, 'A')
+    array_cache.put(2, 'B')
+    print(array_cache.get(1))  # Output: 'A'
+    array_cache.put(3, 'C')     # Evicts key 2 and reuses its slot
+    print(array_cache.get(2))  # Output: -1 (not found)
+    array_cache.put(3, 'c')     # Updates the value in place
+    print(array_cache)          # Output: ArrayLRUCache([3: c, 1: A])
+
+    benchmark()
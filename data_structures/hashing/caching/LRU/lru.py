@@ -18,9 +18,125 @@ indicating that it is the most recently used.
 
 When the cache reaches its limit, the least recently used 
 item (the one at the back of the list) is removed to make space for new items.
+
+Entries can also be given a time-to-live (TTL), either per entry in `put` or through
+a default for the whole cache. Expired entries are dropped lazily when `get` finds them,
+and `sweep_expired` reclaims them in bounded batches (optionally from a background
+ExpirySweeper thread) so dead entries do not pile up and no single sweep causes a long pause.
+Expiry times are kept in a min-heap. When a node is evicted, updated or deleted its heap entry
+is marked dead and lets go of the node. Every time an entry is marked dead or the cache shrinks,
+the heap is rebuilt without its dead entries if they outnumber the entries of the cache, so the
+heap never holds more than twice as many entries as the cache.
+The clock is injectable so expiry can be tested deterministically.
+
+In weighted mode the cache is bounded by the total weight of its values instead of
+(or as well as) the number of items. A weigher such as `sys.getsizeof` measures every value,
+the least recently used items are evicted until the new entry fits, and entries heavier
+than the whole budget are rejected.
+
+Statistics (hits, misses, inserts, updates, evictions and optional latency histograms)
+are recorded only when `record_stats=True`. The instrumented get/put are bound to the
+instance at construction time, so a cache without stats runs exactly the plain code path.
+Because `-1` can be a legitimate value, `get` also accepts a `default` returned on a miss,
+for example the `MISSING` sentinel.
+
+Batched operations (`get_many`, `put_many`, `delete_many`) touch many keys per call.
+They relink the nodes inline in a single pass, without the per-key method calls of get/put,
+and eviction runs once at the end of the batch instead of once per item.
 """
 
-from typing import Any
+import gc
+import heapq
+import itertools
+from collections import abc
+import random
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple, Union
+
+MISSING = object() # Sentinel for get(key, MISSING) that cannot collide with a cached value
+
+
+class LatencyHistogram:
+    """
+    A histogram of operation latencies with power-of-two nanosecond buckets.
+    Bucket i counts latencies in [2 ** (i - 1), 2 ** i) nanoseconds, so recording is O(1)
+    and percentiles are accurate to within a factor of two.
+    """
+    def __init__(self):
+        self.buckets = [0] * 64
+        self.count = 0
+        self.total_ns = 0
+
+    def record(self, elapsed_ns: int):
+        """Add one latency sample"""
+        self.buckets[min(elapsed_ns.bit_length(), 63)] += 1
+        self.count += 1
+        self.total_ns += elapsed_ns
+
+    def percentile(self, percent: float) -> int:
+        """Upper bound (in nanoseconds) of the bucket holding the given percentile"""
+        if not self.count:
+            return 0
+        threshold = self.count * percent / 100
+        seen = 0
+        for bucket, bucket_count in enumerate(self.buckets):
+            seen += bucket_count
+            if seen >= threshold:
+                return 1 << bucket
+        return 1 << 63
+
+    def mean(self) -> float:
+        """Average latency in nanoseconds"""
+        return self.total_ns / self.count if self.count else 0.0
+
+
+class CacheStats:
+    """
+    Counters describing how a cache is being used.
+    - hits/misses: get calls that found / did not find a live entry
+    - inserts/updates: put calls for new / existing keys
+    - evictions: entries pushed out to respect capacity or max_weight
+    - expirations: entries removed because their time-to-live ran out
+    - rejections: values heavier than max_weight that were not stored
+    """
+    def __init__(self, record_latency: bool = False):
+        self.hits = 0
+        self.misses = 0
+        self.inserts = 0
+        self.updates = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.rejections = 0
+        self.get_latency: Optional[LatencyHistogram] = LatencyHistogram() if record_latency else None
+        self.put_latency: Optional[LatencyHistogram] = LatencyHistogram() if record_latency else None
+
+    def hit_ratio(self) -> float:
+        """Fraction of get calls that were hits"""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        """All counters (and latency percentiles, if recorded) as a dictionary"""
+        result = {
+            "hits": self.hits,
+            "misses": self.misses,
+            "inserts": self.inserts,
+            "updates": self.updates,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "rejections": self.rejections,
+            "hit_ratio": self.hit_ratio(),
+        }
+        for name, histogram in (("get", self.get_latency), ("put", self.put_latency)):
+            if histogram is not None:
+                result[f"{name}_latency_ns"] = {"mean": histogram.mean(),
+                                                "p50": histogram.percentile(50),
+                                                "p99": histogram.percentile(99)}
+        return result
+
+    def __repr__(self):
+        return f"CacheStats({self.as_dict()})"
 
 
 class Node:
@@ -29,9 +145,12 @@ class Node:
     Each node contains a key, data, and pointers to the previous and next nodes.
     This is used to maintain the order of usage in the LRU Cache.
     """
-    def __init__(self, key: Any, data:Any):
+    def __init__(self, key: Any, data:Any, expires_at: Optional[float] = None, weight: int = 0):
         self.key = key
         self.data = data
+        self.expires_at = expires_at # Clock time after which the node is stale (None = never)
+        self.weight = weight # Weight of the data in weighted mode, 0 otherwise
+        self.heap_entry: Optional[list] = None # [expires_at, tie-breaker, node] in the expiry heap
         self.prev:Node = None
         self.next:Node = None
 
@@ -40,8 +159,31 @@ class LRUCache:
     A class representing a Least Recently Used (LRU) Cache.
     It uses a combination of a hash map and a doubly linked list to achieve O(1) time complexity for
     both get and put operations.
+
+    Args:
+      capacity (Optional[int]): The maximum number of items kept in the cache.
+        None means no item limit, which only makes sense together with max_weight.
+      default_ttl (Optional[float]): Time-to-live applied when `put` is called without a ttl.
+        None means entries never expire.
+      clock (Callable[[], float]): Returns the current time, `time.monotonic` by default.
+      sweep_batch (int): How many expired entries each `put` may reclaim. 0 disables it.
+      weigher (Optional[Callable[[Any], int]]): Returns the weight of a value, e.g. `sys.getsizeof`.
+      max_weight (Optional[int]): The maximum total weight of all values. Requires a weigher.
+      record_stats (bool): Keep hit/miss/insert/update/eviction counters in `self.stats`.
+      record_latency (bool): Also keep get/put latency histograms. Implies record_stats.
+      on_evict (Optional[Callable[[Any, Any], None]]): Called with (key, value) for every entry
+        evicted to respect capacity or max_weight.
     """
-    def __init__(self, capacity: int):
+    def __init__(self, capacity: Optional[int], default_ttl: Optional[float] = None,
+                 clock: Callable[[], float] = time.monotonic, sweep_batch: int = 0,
+                 weigher: Optional[Callable[[Any], int]] = None, max_weight: Optional[int] = None,
+                 record_stats: bool = False, record_latency: bool = False,
+                 on_evict: Optional[Callable[[Any, Any], None]] = None):
+        if capacity is None and max_weight is None:
+            raise ValueError("Either capacity or max_weight must be set")
+        if (weigher is None) != (max_weight is None):
+            raise ValueError("weigher and max_weight must be given together")
+
         self.capacity = capacity
         self.cache = {} # Dictionary to store key and node mapping
         self.head = Node(None, None) # Dummy head node
@@ -49,6 +191,30 @@ class LRUCache:
         self.head.next = self.tail # Initialize the doubly linked list
         self.tail.prev = self.head # Initialize the doubly linked list
 
+        self.default_ttl = default_ttl
+        self.clock = clock
+        self.sweep_batch = sweep_batch
+        # Min-heap of [expires_at, tie-breaker, node]; dead entries have node None
+        self._expiry_heap = []
+        self._expiry_counter = itertools.count()
+        self._dead_entries = 0 # Dead entries still in the heap
+
+        self.weigher = weigher
+        self.max_weight = max_weight
+        self.total_weight = 0 # Current total weight of all values in the cache
+
+        self.on_evict = on_evict
+        self.stats: Optional[CacheStats] = None
+        if record_stats or record_latency:
+            self.stats = CacheStats(record_latency)
+            # Shadow the plain methods on this instance only, so caches without stats pay nothing
+            if record_latency:
+                self.get = self._timed_get
+                self.put = self._timed_put
+            else:
+                self.get = self._counted_get
+                self.put = self._counted_put
+
     def _del_node(self, node: Node):
         """Delete a node from the doubly linked list"""
         # Unlink the node from its neighbors
@@ -71,43 +237,352 @@ class LRUCache:
         node.next = next_node
         next_node.prev = node
 
-    def get(self, key: Any) -> Any:
-        """Get the value of the key if it exists in the cache, otherwise return -1"""
+    def _remove_node(self, node: Node):
+        """Remove a node from both the linked list and the hash map"""
+        self._del_node(node)
+        del self.cache[node.key]
+        self.total_weight -= node.weight
+        if node.heap_entry is not None:
+            self._forget_expiry(node)
+        elif self._dead_entries > len(self.cache):
+            self._compact_expiry_heap()
+
+    def _push_expiry(self, node: Node):
+        """Track the node's expiry time so the sweeper can find it without scanning the list"""
+        node.heap_entry = [node.expires_at, next(self._expiry_counter), node]
+        heapq.heappush(self._expiry_heap, node.heap_entry)
+
+    def _forget_expiry(self, node: Node):
+        """
+        Mark the node's heap entry as dead so the entry no longer keeps the node (and its value) alive.
+        Once dead entries outnumber the entries of the cache, the heap is rebuilt without them.
+        """
+        node.heap_entry[2] = None
+        node.heap_entry = None
+        self._dead_entries += 1
+        if self._dead_entries > len(self.cache):
+            self._compact_expiry_heap()
+
+    def _compact_expiry_heap(self):
+        """Rebuild the expiry heap without its dead entries"""
+        self._expiry_heap = [entry for entry in self._expiry_heap if entry[2] is not None]
+        heapq.heapify(self._expiry_heap)
+        self._dead_entries = 0
+
+    def _evict_lru(self):
+        """Evict the least recently used node (the one right before the tail)"""
+        node = self.tail.prev
+        self._remove_node(node)
+        if self.stats is not None:
+            self.stats.evictions += 1
+        if self.on_evict is not None:
+            self.on_evict(node.key, node.data)
+
+    def _evict_many(self, count: int):
+        """Evict the `count` least recently used nodes, cutting them off the list in one splice"""
+        cache = self.cache
+        node = self.tail.prev
+        for _ in range(count):
+            del cache[node.key]
+            self.total_weight -= node.weight
+            if node.heap_entry is not None:
+                self._forget_expiry(node)
+            if self.on_evict is not None:
+                self.on_evict(node.key, node.data)
+            # Unlink the evicted nodes from each other too: a cut-off chain would be a reference
+            # cycle that only the garbage collector could free
+            prev_node = node.prev
+            node.prev = node.next = None
+            node = prev_node
+
+        # `node` is now the least recently used survivor (or the head)
+        node.next = self.tail
+        self.tail.prev = node
+        if self._dead_entries > len(cache):
+            self._compact_expiry_heap()
+
+        if self.stats is not None:
+            self.stats.evictions += count
+
+    def _is_expired(self, node: Node, now: float) -> bool:
+        """Check whether the node has outlived its time-to-live"""
+        return node.expires_at is not None and node.expires_at <= now
+
+    def get(self, key: Any, default: Any = -1) -> Any:
+        """Get the value of the key if it exists in the cache, otherwise return default (-1)"""
         if key not in self.cache:
-            return -1
+            return default
 
-        # Move the accessed node to the front (most recently used)
         node = self.cache[key]
+
+        # Lazily drop the entry if it has expired
+        if node.expires_at is not None and self._is_expired(node, self.clock()):
+            self._remove_node(node)
+            if self.stats is not None:
+                self.stats.expirations += 1
+            return default
+
+        # Move the accessed node to the front (most recently used)
         self._del_node(node)
         self._add_node(node)
 
         return node.data
 
-    def put(self, key: Any, value: Any) -> None:
-        """Insert or update the value of the key in the cache"""
+    def put(self, key: Any, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Insert or update the value of the key in the cache.
+        The entry expires after `ttl` (or the cache's default_ttl) units of the clock.
+        In weighted mode a value heavier than max_weight is rejected (and any old value
+        for the key is dropped, so a stale value is never served).
+        """
+
+        # Reclaim a bounded number of expired entries before making room
+        if self.sweep_batch and self._expiry_heap:
+            self.sweep_expired(self.sweep_batch)
 
         # If the key already exists, update the value and move it to the front
         if key in self.cache:
             #  Remove the old node from the cache and the linked list
-            node = self.cache[key]
-            self._del_node(node)
-            del self.cache[key]
+            self._remove_node(self.cache[key])
+
+        # Measure the value in weighted mode and reject it if it can never fit
+        weight = 0
+        if self.weigher is not None:
+            weight = self.weigher(value)
+            if weight > self.max_weight:
+                if self.stats is not None:
+                    self.stats.rejections += 1
+                return
 
         # If the cache is at capacity, remove the least recently used item
-        if len(self.cache) >= self.capacity:
+        if self.capacity is not None and len(self.cache) >= self.capacity:
 
             # Remove the node before the tail (the least recently used item)
-            lru_node = self.tail.prev
-            self._del_node(lru_node)
-            del self.cache[lru_node.key]
+            self._evict_lru()
+
+        # Keep evicting the least recently used items until the new value fits
+        if self.weigher is not None:
+            while self.total_weight + weight > self.max_weight:
+                self._evict_lru()
+
+        # Work out when the new entry goes stale, if ever
+        if ttl is None:
+            ttl = self.default_ttl
+        expires_at = None
+        if ttl is not None:
+            expires_at = self.clock() + ttl
 
         # Create a new node for the key-value pair
-        new_node = Node(key, value)
+        new_node = Node(key, value, expires_at, weight)
 
         # Add the new node to the front of the linked list
         self._add_node(new_node)
         # Add the new node to the cache
         self.cache[key] = new_node
+        self.total_weight += weight
+
+        if expires_at is not None:
+            self._push_expiry(new_node)
+
+    def sweep_expired(self, max_items: int = 100) -> int:
+        """
+        Remove up to `max_items` expired entries and return how many were removed.
+        Dead heap entries (left behind by updated, evicted or deleted nodes) reaching the top of
+        the heap are discarded along the way and count towards the batch, so a single call never
+        does unbounded work.
+        """
+        now = self.clock()
+        removed = 0
+        examined = 0
+
+        while self._expiry_heap and examined < max_items:
+            expires_at, _, node = self._expiry_heap[0]
+            if expires_at > now:
+                break
+
+            heapq.heappop(self._expiry_heap)
+            examined += 1
+
+            if node is None:
+                self._dead_entries -= 1
+                continue
+
+            node.heap_entry = None # Already popped, nothing left to mark
+            self._remove_node(node)
+            removed += 1
+
+        if removed and self.stats is not None:
+            self.stats.expirations += removed
+        return removed
+
+    def get_many(self, keys: Iterable[Any]) -> Tuple[Dict[Any, Any], List[Any]]:
+        """
+        Look up many keys at once.
+        Returns a dictionary of the keys found with their values, and a list of the missing keys.
+        The found keys become the most recently used ones, the last key of the batch first,
+        exactly as if get had been called once per key. For a single key, get is as fast.
+        """
+        cache = self.cache
+        head = self.head
+        found = {}
+        missing = []
+        expired = 0
+        now = None
+
+        for key in keys:
+            node = cache.get(key)
+            if node is None:
+                missing.append(key)
+                continue
+
+            # Lazily drop the entry if it has expired
+            if node.expires_at is not None:
+                if now is None:
+                    now = self.clock()
+                if node.expires_at <= now:
+                    self._remove_node(node)
+                    expired += 1
+                    missing.append(key)
+                    continue
+
+            # Move the node to the front inline, without the two method calls get pays per key
+            prev_node = node.prev
+            next_node = node.next
+            prev_node.next = next_node
+            next_node.prev = prev_node
+            first = head.next
+            node.prev = head
+            node.next = first
+            first.prev = node
+            head.next = node
+            found[key] = node.data
+
+        if self.stats is not None:
+            self.stats.hits += len(found)
+            self.stats.misses += len(missing)
+            self.stats.expirations += expired
+
+        return found, missing
+
+    def put_many(self, items: Union[Mapping[Any, Any], Iterable[Tuple[Any, Any]]],
+                 ttl: Optional[float] = None) -> None:
+        """
+        Insert or update many key-value pairs at once, all with the same ttl.
+        The pairs are applied in order, so a repeated key keeps its last value and its last position,
+        as with calling put once per pair. Eviction runs once, after the whole batch is in place:
+        with a capacity it leaves the same entries as the individual puts, and in weighted mode
+        it can keep some that they would have dropped to make room along the way.
+        """
+        if self.sweep_batch and self._expiry_heap:
+            self.sweep_expired(self.sweep_batch)
+
+        # Work out once when the new entries go stale, if ever
+        if ttl is None:
+            ttl = self.default_ttl
+        expires_at = None
+        if ttl is not None:
+            expires_at = self.clock() + ttl
+
+        cache = self.cache
+        head = self.head
+        weigher = self.weigher
+        inserts = updates = rejections = 0
+
+        for key, value in (items.items() if isinstance(items, abc.Mapping) else items):
+            weight = 0
+            if weigher is not None:
+                weight = weigher(value)
+                if weight > self.max_weight:
+                    rejections += 1
+                    # Never keep serving the old value of a rejected update
+                    if key in cache:
+                        self._remove_node(cache[key])
+                    continue
+
+            node = cache.get(key)
+            if node is not None:
+                # Update the existing node in place instead of allocating a new one
+                prev_node = node.prev
+                next_node = node.next
+                prev_node.next = next_node
+                next_node.prev = prev_node
+                self.total_weight += weight - node.weight
+                node.data = value
+                node.expires_at = expires_at
+                node.weight = weight
+                if node.heap_entry is not None:
+                    self._forget_expiry(node)
+                updates += 1
+            else:
+                node = Node(key, value, expires_at, weight)
+                cache[key] = node
+                self.total_weight += weight
+                inserts += 1
+
+            # Link the node right after the head
+            first = head.next
+            node.prev = head
+            node.next = first
+            first.prev = node
+            head.next = node
+
+            if expires_at is not None:
+                self._push_expiry(node)
+
+        if self.stats is not None:
+            self.stats.inserts += inserts
+            self.stats.updates += updates
+            self.stats.rejections += rejections
+
+        # Evict once for the whole batch
+        if self.capacity is not None and len(cache) > self.capacity:
+            self._evict_many(len(cache) - self.capacity)
+        if weigher is not None:
+            while self.total_weight > self.max_weight:
+                self._evict_lru()
+
+    def delete_many(self, keys: Iterable[Any]) -> int:
+        """Remove many keys at once and return how many of them were in the cache"""
+        cache = self.cache
+        removed = 0
+        for key in keys:
+            node = cache.get(key)
+            if node is not None:
+                self._remove_node(node)
+                removed += 1
+        return removed
+
+    def _counted_get(self, key: Any, default: Any = -1) -> Any:
+        """get() that also counts hits and misses"""
+        value = LRUCache.get(self, key, MISSING)
+        if value is MISSING:
+            self.stats.misses += 1
+            return default
+        self.stats.hits += 1
+        return value
+
+    def _counted_put(self, key: Any, value: Any, ttl: Optional[float] = None) -> None:
+        """put() that also counts inserts and updates (a rejected value counts as neither)"""
+        existed = key in self.cache
+        LRUCache.put(self, key, value, ttl)
+        if key in self.cache:
+            if existed:
+                self.stats.updates += 1
+            else:
+                self.stats.inserts += 1
+
+    def _timed_get(self, key: Any, default: Any = -1) -> Any:
+        """get() that counts hits and misses and records its latency"""
+        start = time.perf_counter_ns()
+        value = self._counted_get(key, default)
+        self.stats.get_latency.record(time.perf_counter_ns() - start)
+        return value
+
+    def _timed_put(self, key: Any, value: Any, ttl: Optional[float] = None) -> None:
+        """put() that counts inserts and updates and records its latency"""
+        start = time.perf_counter_ns()
+        self._counted_put(key, value, ttl)
+        self.stats.put_latency.record(time.perf_counter_ns() - start)
 
     def __repr__(self):
         """String representation of the cache for debugging"""
@@ -118,6 +593,75 @@ class LRUCache:
             current = current.next
         return "LRUCache([" + ", ".join(items) + "])"
 
+
+def benchmark_batch_operations(batch_sizes: Tuple[int, ...] = (1, 10, 100, 1_000, 10_000),
+                               capacity: int = 100_000, keys_per_size: int = 200_000):
+    """
+    Compare get_many/put_many with calling get/put once per key in a Python loop.
+    The cache is prefilled and every batch mixes hits with misses.
+    """
+    print(f"{'batch':>7} | {'get loop':>11} | {'get_many':>11} | {'put loop':>11} | {'put_many':>11}  (keys/s)")
+    for batch_size in batch_sizes:
+        batches = [[(key, key) for key in random.choices(range(2 * capacity), k=batch_size)]
+                   for _ in range(max(keys_per_size // batch_size, 1))]
+        key_batches = [[key for key, _ in batch] for batch in batches]
+        num_keys = len(batches) * batch_size
+        results = []
+
+        for batched in (False, True):
+            cache = LRUCache(capacity)
+            cache.put_many((key, key) for key in range(capacity))
+            gc.collect() # Free the previous run's cache now, not during this measurement
+            start = time.perf_counter()
+            for keys in key_batches:
+                if batched:
+                    cache.get_many(keys)
+                else:
+                    for key in keys:
+                        cache.get(key)
+            results.append(num_keys / (time.perf_counter() - start))
+
+        for batched in (False, True):
+            cache = LRUCache(capacity)
+            gc.collect()
+            start = time.perf_counter()
+            for batch in batches:
+                if batched:
+                    cache.put_many(batch)
+                else:
+                    for key, value in batch:
+                        cache.put(key, value)
+            results.append(num_keys / (time.perf_counter() - start))
+
+        print(f"{batch_size:>7} | {results[0]:>11,.0f} | {results[1]:>11,.0f} | {results[2]:>11,.0f} | {results[3]:>11,.0f}")
+
+
+class ExpirySweeper(threading.Thread):
+    """
+    A daemon thread that periodically reclaims expired entries from an LRUCache.
+    The LRUCache itself is not thread-safe, so every call made on the cache while
+    the sweeper runs must hold `sweeper.lock`.
+    """
+    def __init__(self, cache: LRUCache, interval: float = 1.0, batch_size: int = 100,
+                 lock: Optional[threading.Lock] = None):
+        super().__init__(daemon=True)
+        self.cache = cache
+        self.interval = interval
+        self.batch_size = batch_size
+        self.lock = lock if lock is not None else threading.Lock()
+        self._stopped = threading.Event()
+
+    def run(self):
+        """Sweep one bounded batch per interval until stopped"""
+        while not self._stopped.wait(self.interval):
+            with self.lock:
+                self.cache.sweep_expired(self.batch_size)
+
+    def stop(self):
+        """Ask the sweeper to stop and wait for it to finish"""
+        self._stopped.set()
+        self.join()
+
 # Example usage
 if __name__ == "__main__":
     lru_cache = LRUCache(2)
@@ -131,3 +675,42 @@ if __name__ == "__main__":
     print(lru_cache.get(3))  # Output: 'C'
     print(lru_cache.get(4))  # Output: 'D'
     print(lru_cache)          # Output: LRUCache([3: C, 4: D])
+
+    # Example of time-to-live with a manual clock
+    now = [0.0]
+    ttl_cache = LRUCache(3, default_ttl=10, clock=lambda: now[0])
+    ttl_cache.put('a', 1)
+    ttl_cache.put('b', 2, ttl=1)
+    now[0] = 5
+    print(ttl_cache.get('b'))          # Output: -1 (expired)
+    print(ttl_cache.get('a'))          # Output: 1
+    now[0] = 20
+    print(ttl_cache.sweep_expired())   # Output: 1 (removes 'a')
+
+    # Example of a cache bounded by the total length of its values
+    weighted_cache = LRUCache(None, weigher=len, max_weight=10)
+    weighted_cache.put('x', 'aaaa')
+    weighted_cache.put('y', 'bbbb')
+    weighted_cache.put('z', 'cccc')      # Evicts 'x' to stay within 10
+    weighted_cache.put('big', 'd' * 11)  # Rejected, heavier than the whole budget
+    print(weighted_cache.total_weight)   # Output: 8
+    print(weighted_cache)                # Output: LRUCache([z: cccc, y: bbbb])
+
+    # Example of statistics, an eviction hook and a miss that cannot be confused with -1
+    evicted = []
+    stats_cache = LRUCache(1, record_stats=True, on_evict=lambda key, value: evicted.append(key))
+    stats_cache.put('n', -1)
+    print(stats_cache.get('n', MISSING))   # Output: -1 (a real value)
+    stats_cache.put('m', 0)                # Evicts 'n'
+    print(stats_cache.get('n', MISSING) is MISSING)  # Output: True
+    print(evicted)                         # Output: ['n']
+    print(stats_cache.stats.hit_ratio())   # Output: 0.5
+
+    # Example of batched operations
+    batch_cache = LRUCache(3)
+    batch_cache.put_many({1: 'A', 2: 'B', 3: 'C', 4: 'D'})  # Evicts key 1 once the batch is in
+    print(batch_cache.get_many([2, 1, 4]))  # Output: ({2: 'B', 4: 'D'}, [1])
+    print(batch_cache.delete_many([2, 3]))  # Output: 2
+    print(batch_cache)                      # Output: LRUCache([4: D])
+
+    benchmark_batch_operations()
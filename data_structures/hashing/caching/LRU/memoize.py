@@ -0,0 +1,227 @@
+"""
+Memoization stores the results of expensive function calls and returns the stored result
+when the same inputs occur again.
+
+The `lru_memoize` decorator puts an LRUCache in front of a function. It works for both regular
+functions and `async def` coroutines, and it adds two things a plain cache lookup does not:
+
+1. Single-flight deduplication:
+   When many callers miss on the same key at the same time, only the first one runs the function.
+   Every other caller waits for that in-flight computation and receives its result (or its exception).
+   This prevents a "thundering herd" of identical recomputations.
+   For coroutines the computation runs as a separate task that every caller awaits through
+   `asyncio.shield`, so a caller that is cancelled (by a timeout, for example) stops waiting
+   without cancelling the computation for the others.
+
+2. Negative caching:
+   Results that mean "nothing found" (None by default) can be cached for a shorter, configurable
+   time so that repeated lookups of missing data do not hit the slow source every time.
+
+Complexity:
+- Cache hit: O(1) plus building the key from the arguments
+- Cache miss: the cost of the function, paid once per key no matter how many callers are waiting
+"""
+
+import asyncio
+import functools
+import inspect
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from data_structures.hashing.caching.LRU.lru import LRUCache
+
+_KWARGS_MARK = object() # Separates positional from keyword arguments in generated keys
+
+
+def make_key(args: tuple, kwargs: dict) -> Hashable:
+    """Build a hashable cache key from positional and keyword arguments"""
+    if not kwargs:
+        return args
+    return args + (_KWARGS_MARK,) + tuple(sorted(kwargs.items()))
+
+
+def lru_memoize(capacity: int = 128, ttl: Optional[float] = None, negative_ttl: float = 0,
+                is_negative: Callable[[Any], bool] = lambda result: result is None,
+                key: Optional[Callable[..., Hashable]] = None,
+                clock: Callable[[], float] = time.monotonic):
+    """
+    Decorator that memoizes a sync or async function in an LRUCache.
+
+    Args:
+      capacity (int): The maximum number of results kept in the cache.
+      ttl (Optional[float]): How long regular results stay valid. None means until evicted.
+      negative_ttl (float): How long negative results stay valid. 0 means they are not cached.
+      is_negative (Callable[[Any], bool]): Decides whether a result is negative.
+      key (Callable[..., Hashable]): Builds the cache key from the call arguments.
+        Defaults to the positional arguments plus the sorted keyword arguments.
+      clock (Callable[[], float]): Returns the current time, `time.monotonic` by default.
+    Returns:
+      The decorated function, with `cache`, `cache_info()` and `cache_clear()` attached.
+    Example:
+      >>> @lru_memoize(capacity=2)
+      ... def square(x):
+      ...     return x * x
+      >>> square(3)
+      9
+      >>> square.cache_info()["misses"]
+      1
+    """
+    make_cache_key = key if key is not None else (lambda *args, **kwargs: make_key(args, kwargs))
+
+    def decorator(func):
+        cache = LRUCache(capacity, clock=clock)
+        lock = threading.Lock() # Guards the cache, the in-flight table and the counters
+        in_flight: Dict[Hashable, Any] = {}
+        counters = {"hits": 0, "misses": 0, "deduplicated": 0}
+
+        def lookup(cache_key):
+            """Return the cached result boxed in a 1-tuple, or None on a miss"""
+            # Results are boxed so that a cached -1 is not mistaken for a miss
+            entry = cache.get(cache_key)
+            if isinstance(entry, tuple):
+                counters["hits"] += 1
+                return entry
+            return None
+
+        def store(cache_key, result):
+            """Cache the result with the TTL that matches its kind"""
+            if is_negative(result):
+                if negative_ttl > 0:
+                    cache.put(cache_key, (result,), ttl=negative_ttl)
+            else:
+                cache.put(cache_key, (result,), ttl=ttl)
+
+        if inspect.iscoroutinefunction(func):
+            async def compute(cache_key, args, kwargs):
+                """Run the function once for every caller waiting on the key, and cache its result"""
+                try:
+                    result = await func(*args, **kwargs)
+                except BaseException:
+                    with lock:
+                        del in_flight[cache_key]
+                    raise
+                with lock:
+                    store(cache_key, result)
+                    del in_flight[cache_key]
+                return result
+
+            def retrieve(task):
+                """Mark the exception as retrieved in case every waiter was cancelled"""
+                if not task.cancelled():
+                    task.exception()
+
+            @functools.wraps(func)
+            async def wrapper(*args, **kwargs):
+                cache_key = make_cache_key(*args, **kwargs)
+
+                with lock:
+                    entry = lookup(cache_key)
+                    if entry is not None:
+                        return entry[0]
+
+                    # Join the computation another coroutine already started
+                    task = in_flight.get(cache_key)
+                    if task is None:
+                        counters["misses"] += 1
+                        # The computation runs as its own task, so it does not belong to any caller
+                        task = asyncio.ensure_future(compute(cache_key, args, kwargs))
+                        task.add_done_callback(retrieve)
+                        in_flight[cache_key] = task
+                    else:
+                        counters["deduplicated"] += 1
+
+                # Every caller, the first one included, waits through a shield:
+                # cancelling one caller never cancels the computation the others are waiting for
+                return await asyncio.shield(task)
+        else:
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                cache_key = make_cache_key(*args, **kwargs)
+
+                with lock:
+                    entry = lookup(cache_key)
+                    if entry is not None:
+                        return entry[0]
+
+                    # Join the computation another thread already started
+                    future = in_flight.get(cache_key)
+                    owner = future is None
+                    if owner:
+                        counters["misses"] += 1
+                        future = Future()
+                        in_flight[cache_key] = future
+                    else:
+                        counters["deduplicated"] += 1
+
+                if not owner:
+                    return future.result()
+
+                try:
+                    result = func(*args, **kwargs)
+                except BaseException as error:
+                    with lock:
+                        del in_flight[cache_key]
+                    future.set_exception(error)
+                    raise
+
+                with lock:
+                    store(cache_key, result)
+                    del in_flight[cache_key]
+                future.set_result(result)
+                return result
+
+        def cache_info() -> Dict[str, int]:
+            """Hits, misses, callers that joined an in-flight call, and the current size"""
+            with lock:
+                return dict(counters, size=len(cache.cache))
+
+        def cache_clear() -> None:
+            """Drop every cached result and reset the counters"""
+            nonlocal cache
+            with lock:
+                cache = LRUCache(capacity, clock=clock)
+                wrapper.cache = cache
+                for name in counters:
+                    counters[name] = 0
+
+        wrapper.cache = cache
+        wrapper.cache_info = cache_info
+        wrapper.cache_clear = cache_clear
+        return wrapper
+
+    return decorator
+
+
+# Example usage
+if __name__ == "__main__":
+    calls = []
+
+    @lru_memoize(capacity=16)
+    def slow_square(x):
+        calls.append(x)
+        time.sleep(0.1)
+        return x * x
+
+    # Ten threads miss on the same key at once, but the function only runs once
+    threads = [threading.Thread(target=slow_square, args=(4,)) for _ in range(10)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    print(calls)                      # Output: [4]
+    print(slow_square.cache_info())   # Output: {'hits': 0, 'misses': 1, 'deduplicated': 9, 'size': 1}
+
+    @lru_memoize(capacity=16, negative_ttl=30)
+    async def fetch_user(user_id):
+        await asyncio.sleep(0.1)
+        return None if user_id < 0 else {"id": user_id}
+
+    async def main():
+        results = await asyncio.gather(*(fetch_user(1) for _ in range(5)), fetch_user(-1))
+        print(results[0])             # Output: {'id': 1}
+        print(await fetch_user(-1))   # Output: None (served from the negative cache)
+        print(fetch_user.cache_info())  # Output: {'hits': 1, 'misses': 2, 'deduplicated': 4, 'size': 2}
+
+    asyncio.run(main())
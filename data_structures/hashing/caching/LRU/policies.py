@@ -0,0 +1,362 @@
+"""
+Scan-resistant eviction policies with the same get/put interface as LRUCache.
+
+Pure LRU only looks at recency. A single large sequential scan (for example a batch job
+reading every key once) pushes the whole working set out of the cache, even though
+none of the scanned keys will be used again.
+
+This module provides two policies that also take frequency into account:
+
+1. ARC (Adaptive Replacement Cache):
+   Keeps two LRU lists, T1 for keys seen once recently and T2 for keys seen at least twice.
+   It also remembers the keys recently evicted from each list (ghost lists B1 and B2, keys only).
+   A hit in a ghost list tells ARC which of the two lists deserved more room,
+   and the target size `p` of T1 adapts accordingly.
+
+2. W-TinyLFU (Window Tiny Least Frequently Used):
+   New keys enter a small LRU window (1% of the capacity). Keys leaving the window must
+   win an admission contest against the main cache's eviction victim: the key with the
+   higher estimated frequency stays. Frequencies come from a Count-Min Sketch of small
+   saturating counters that are halved periodically so old popularity fades away.
+   The main cache is a segmented LRU (probation + protected).
+
+The `replay` harness runs key traces (Zipfian, scan plus hot set, loops) against every policy
+and reports the hit ratio and ops/sec, so a policy can be chosen from data.
+
+Complexity:
+- get/put: O(1) for every policy (W-TinyLFU also updates four sketch counters)
+- Space: O(capacity); ARC keeps up to `capacity` extra ghost keys
+
+Run the trace comparison from the repository root:
+    python -m data_structures.hashing.caching.LRU.policies
+"""
+
+import bisect
+import itertools
+import random
+import time
+from array import array
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from data_structures.hashing.caching.LRU.array_lru import ArrayLRUCache
+from data_structures.hashing.caching.LRU.lru import LRUCache
+
+
+class ARCCache:
+    """
+    A cache using the Adaptive Replacement Cache (ARC) policy.
+    Every OrderedDict is kept with the least recently used key first.
+    """
+    def __init__(self, capacity: int):
+        if capacity <= 0:
+            raise ValueError("Invalid value of capacity")
+
+        self.capacity = capacity
+        self.p = 0 # Target size of T1, adapted on ghost hits
+        self.t1 = OrderedDict() # Seen once recently: key -> value
+        self.t2 = OrderedDict() # Seen at least twice recently: key -> value
+        self.b1 = OrderedDict() # Ghosts evicted from T1: key -> None
+        self.b2 = OrderedDict() # Ghosts evicted from T2: key -> None
+
+    def _replace(self, in_b2: bool):
+        """Evict the LRU entry of T1 or T2 into its ghost list, depending on the target p"""
+        if self.t1 and (len(self.t1) > self.p or (in_b2 and len(self.t1) == self.p)):
+            key, _ = self.t1.popitem(last=False)
+            self.b1[key] = None
+        else:
+            key, _ = self.t2.popitem(last=False)
+            self.b2[key] = None
+
+    def get(self, key: Any) -> Any:
+        """Get the value of the key if it exists in the cache, otherwise return -1"""
+        if key in self.t1:
+            # Second access promotes the key from T1 to T2
+            value = self.t1.pop(key)
+            self.t2[key] = value
+            return value
+
+        if key in self.t2:
+            self.t2.move_to_end(key)
+            return self.t2[key]
+
+        return -1
+
+    def put(self, key: Any, value: Any) -> None:
+        """Insert or update the value of the key in the cache"""
+        # Case I: the key is cached, update it and treat it as a hit
+        if key in self.t1:
+            del self.t1[key]
+            self.t2[key] = value
+            return
+        if key in self.t2:
+            self.t2[key] = value
+            self.t2.move_to_end(key)
+            return
+
+        # Case II: ghost hit in B1, recency deserved more room
+        if key in self.b1:
+            self.p = min(self.capacity, self.p + max(len(self.b2) // len(self.b1), 1))
+            self._replace(False)
+            del self.b1[key]
+            self.t2[key] = value
+            return
+
+        # Case III: ghost hit in B2, frequency deserved more room
+        if key in self.b2:
+            self.p = max(0, self.p - max(len(self.b1) // len(self.b2), 1))
+            self._replace(True)
+            del self.b2[key]
+            self.t2[key] = value
+            return
+
+        # Case IV: a brand new key
+        l1 = len(self.t1) + len(self.b1)
+        total = l1 + len(self.t2) + len(self.b2)
+        if l1 == self.capacity:
+            if len(self.t1) < self.capacity:
+                self.b1.popitem(last=False)
+                self._replace(False)
+            else:
+                self.t1.popitem(last=False)
+        elif total >= self.capacity:
+            if total == 2 * self.capacity:
+                self.b2.popitem(last=False)
+            self._replace(False)
+
+        self.t1[key] = value
+
+    def __len__(self):
+        return len(self.t1) + len(self.t2)
+
+
+class CountMinSketch:
+    """
+    A Count-Min Sketch of small saturating counters (capped at 15, stored one per byte)
+    used to estimate key frequencies.
+    After `sample_size` increments every counter is halved, so the estimates favour recent history.
+    """
+    _MASK = 0xFFFFFFFFFFFFFFFF
+    _MAX_COUNT = 15
+
+    def __init__(self, capacity: int):
+        # Four rows whose width is the next power of two above the capacity
+        self.width_bits = max(capacity - 1, 1).bit_length()
+        self.width = 1 << self.width_bits
+        self.shift = 64 - self.width_bits
+        self.table = array('B', bytes(self.width * 4))
+        self.sample_size = 10 * capacity
+        self.additions = 0
+
+    def _indexes(self, key: Any) -> Tuple[int, int, int, int]:
+        """One counter index per row, from multiplicative hashing of the key's hash with a per-row seed"""
+        h = hash(key) & self._MASK
+        mask, shift, width = self._MASK, self.shift, self.width
+        # The rows are unrolled because this runs on every cache access
+        return (((h * 0x9E3779B97F4A7C15) & mask) >> shift,
+                width + (((h * 0xC2B2AE3D27D4EB4F) & mask) >> shift),
+                2 * width + (((h * 0x165667B19E3779F9) & mask) >> shift),
+                3 * width + (((h * 0x27D4EB2F165667C5) & mask) >> shift))
+
+    def increment(self, key: Any):
+        """Record one access to the key"""
+        table = self.table
+        for index in self._indexes(key):
+            if table[index] < self._MAX_COUNT:
+                table[index] += 1
+
+        self.additions += 1
+        if self.additions >= self.sample_size:
+            self._reset()
+
+    def estimate(self, key: Any) -> int:
+        """Estimated access count of the key (never an underestimate before aging)"""
+        return min(self.table[index] for index in self._indexes(key))
+
+    def _reset(self):
+        """Halve every counter so old popularity fades"""
+        self.table = array('B', (count >> 1 for count in self.table))
+        self.additions //= 2
+
+
+_NO_KEY = object() # No get has missed since the last put
+
+
+class WTinyLFUCache:
+    """
+    A cache using the W-TinyLFU policy: an LRU window in front of a segmented LRU main cache,
+    with a frequency sketch deciding which keys are admitted into the main cache.
+    The capacity must be at least 2 (one slot for the window, one for the main cache);
+    the window and main capacities add up to exactly `capacity`.
+    """
+    def __init__(self, capacity: int, window_ratio: float = 0.01, protected_ratio: float = 0.8):
+        if capacity < 2:
+            raise ValueError("Invalid value of capacity: W-TinyLFU needs at least 2 slots")
+
+        self.capacity = capacity
+        self.window_capacity = min(max(1, int(capacity * window_ratio)), capacity - 1)
+        self.main_capacity = capacity - self.window_capacity
+        self.protected_capacity = int(self.main_capacity * protected_ratio)
+
+        self.window = OrderedDict() # key -> value, least recently used first
+        self.probation = OrderedDict() # Main cache segment for keys seen once in main
+        self.protected = OrderedDict() # Main cache segment for keys hit while in probation
+        self.sketch = CountMinSketch(capacity)
+        # Key of the last get that missed: its access is already counted when the put follows
+        self._last_miss: Any = _NO_KEY
+
+    def _promote(self, key: Any, value: Any):
+        """Move a probation hit into the protected segment, demoting its LRU if it is full"""
+        del self.probation[key]
+        self.protected[key] = value
+        if len(self.protected) > self.protected_capacity:
+            demoted_key, demoted_value = self.protected.popitem(last=False)
+            self.probation[demoted_key] = demoted_value
+
+    def _admit(self, key: Any, value: Any):
+        """Let a key leaving the window into the main cache if it beats the main victim"""
+        if len(self.probation) + len(self.protected) < self.main_capacity:
+            self.probation[key] = value
+            return
+
+        # The victim is the probation LRU, or the protected LRU if probation is empty
+        segment = self.probation if self.probation else self.protected
+        victim = next(iter(segment))
+        if self.sketch.estimate(key) > self.sketch.estimate(victim):
+            del segment[victim]
+            self.probation[key] = value
+
+    def get(self, key: Any) -> Any:
+        """Get the value of the key if it exists in the cache, otherwise return -1"""
+        self.sketch.increment(key)
+
+        if key in self.window:
+            self.window.move_to_end(key)
+            return self.window[key]
+
+        if key in self.protected:
+            self.protected.move_to_end(key)
+            return self.protected[key]
+
+        if key in self.probation:
+            value = self.probation[key]
+            self._promote(key, value)
+            return value
+
+        self._last_miss = key
+        return -1
+
+    def put(self, key: Any, value: Any) -> None:
+        """Insert or update the value of the key in the cache"""
+        if key in self.window:
+            self.window[key] = value
+            self.window.move_to_end(key)
+            return
+
+        if key in self.protected:
+            self.protected[key] = value
+            self.protected.move_to_end(key)
+            return
+
+        if key in self.probation:
+            self._promote(key, value)
+            return
+
+        # New keys always enter the window; its overflow competes for the main cache.
+        # A put right after the get that missed is the same access, so it is counted only once.
+        if self._last_miss is _NO_KEY or self._last_miss != key:
+            self.sketch.increment(key)
+        self._last_miss = _NO_KEY
+        self.window[key] = value
+        if len(self.window) > self.window_capacity:
+            candidate, candidate_value = self.window.popitem(last=False)
+            self._admit(candidate, candidate_value)
+
+    def __len__(self):
+        return len(self.window) + len(self.probation) + len(self.protected)
+
+
+def zipf_trace(length: int, num_keys: int, alpha: float = 0.99, seed: int = 0) -> List[int]:
+    """Keys drawn from a Zipf distribution: key k is requested with probability ~ 1 / (k + 1) ** alpha"""
+    rng = random.Random(seed)
+    cumulative = list(itertools.accumulate(1 / (rank + 1) ** alpha for rank in range(num_keys)))
+    total = cumulative[-1]
+    return [bisect.bisect_left(cumulative, rng.random() * total) for _ in range(length)]
+
+
+def scan_trace(length: int, hot_keys: int, scan_length: int, seed: int = 0) -> List[int]:
+    """A Zipfian hot set interrupted by long sequential scans of keys that are never reused"""
+    hot = zipf_trace(length, hot_keys, seed=seed)
+    trace = []
+    next_scan_key = hot_keys
+    for position, key in enumerate(hot):
+        trace.append(key)
+        # Every so often a scan runs through `scan_length` fresh keys
+        if position % (4 * scan_length) == 0 and position:
+            trace.extend(range(next_scan_key, next_scan_key + scan_length))
+            next_scan_key += scan_length
+    return trace[:length]
+
+
+def loop_trace(length: int, loop_size: int) -> List[int]:
+    """The same keys requested in a loop, the classic worst case for LRU when loop_size > capacity"""
+    return [position % loop_size for position in range(length)]
+
+
+def replay(trace: Iterable[Any], cache) -> Dict[str, float]:
+    """
+    Replay a key trace against a cache: each miss is followed by a put, like a read-through cache.
+    Returns the hit ratio and the number of requests served per second.
+    """
+    hits = 0
+    requests = 0
+    start = time.perf_counter()
+    for key in trace:
+        requests += 1
+        if cache.get(key) == -1:
+            cache.put(key, key)
+        else:
+            hits += 1
+    elapsed = time.perf_counter() - start
+
+    return {"hit_ratio": hits / requests if requests else 0.0,
+            "ops_per_sec": requests / elapsed if elapsed else 0.0}
+
+
+def compare_policies(capacity: int = 1_000, length: int = 200_000,
+                     policies: Optional[Dict[str, Callable[[int], Any]]] = None):
+    """Print the hit ratio and ops/sec of every policy on every synthetic trace"""
+    if policies is None:
+        policies = {"LRU": LRUCache, "ArrayLRU": ArrayLRUCache, "ARC": ARCCache, "W-TinyLFU": WTinyLFUCache}
+
+    traces = {
+        "zipf": zipf_trace(length, 20 * capacity),
+        "scan + hot set": scan_trace(length, 2 * capacity, 5 * capacity),
+        "loop": loop_trace(length, capacity + capacity // 2),
+    }
+
+    print(f"{'trace':>15} | {'policy':>10} | {'hit ratio':>9} | {'ops/s':>12}")
+    for trace_name, trace in traces.items():
+        for policy_name, policy in policies.items():
+            result = replay(trace, policy(capacity))
+            print(f"{trace_name:>15} | {policy_name:>10} | {result['hit_ratio']:>9.3f} | {result['ops_per_sec']:>12,.0f}")
+
+
+# Example usage
+if __name__ == "__main__":
+    arc_cache = ARCCache(2)
+    arc_cache.put(1, 'A')
+    arc_cache.put(2, 'B')
+    print(arc_cache.get(1))   # Output: 'A' (now in T2, frequently used)
+    arc_cache.put(3, 'C')      # Evicts key 2 from T1, not the frequently used key 1
+    print(arc_cache.get(2))   # Output: -1 (not found)
+    print(arc_cache.get(1))   # Output: 'A'
+
+    # A miss followed by the put that fills it is one access for the frequency sketch
+    tiny_lfu = WTinyLFUCache(100)
+    tiny_lfu.get('x')
+    tiny_lfu.put('x', 1)
+    tiny_lfu.put('y', 2)  # A write without a lookup counts once as well
+    print(tiny_lfu.sketch.estimate('x'), tiny_lfu.sketch.estimate('y'))  # Output: 1 1
+
+    compare_policies()
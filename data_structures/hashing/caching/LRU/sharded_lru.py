@@ -0,0 +1,201 @@
+"""
+A Sharded LRU Cache is a thread-safe cache made of several independent LRU caches (shards).
+
+A plain LRU Cache mutates its dictionary and its doubly linked list on every get and put,
+so sharing one instance between threads means wrapping every call in a single global lock.
+Every worker thread then contends on that one lock.
+
+The sharded cache splits the key space into N partitions using the hash of the key.
+Each partition is a regular LRUCache protected by its own lock, so two threads
+touching keys in different shards never wait on each other.
+
+Trade-offs:
+- The capacity is divided between the shards, so eviction is LRU per shard
+  and only approximately LRU for the cache as a whole.
+- Size and statistics are global views computed by summing over the shards.
+
+Complexity:
+- get/put: O(1) (one hash to pick the shard, then a regular LRU operation)
+- len/stats: O(N), where N is the number of shards
+
+Run the benchmark from the repository root:
+    python -m data_structures.hashing.caching.LRU.sharded_lru
+"""
+
+import random
+import threading
+import time
+from typing import Any, Dict, Tuple
+
+from data_structures.hashing.caching.LRU.lru import LRUCache
+
+
+class SingleLockLRUCache:
+    """
+    An LRUCache wrapped in one global lock.
+    This is the baseline that the sharded cache is compared against.
+    """
+    def __init__(self, capacity: int):
+        self.cache = LRUCache(capacity)
+        self.lock = threading.Lock()
+
+    def get(self, key: Any) -> Any:
+        """Get the value of the key if it exists in the cache, otherwise return -1"""
+        with self.lock:
+            return self.cache.get(key)
+
+    def put(self, key: Any, value: Any) -> None:
+        """Insert or update the value of the key in the cache"""
+        with self.lock:
+            self.cache.put(key, value)
+
+    def __len__(self):
+        with self.lock:
+            return len(self.cache.cache)
+
+
+class ShardedLRUCache:
+    """
+    A thread-safe LRU Cache that partitions keys across independently locked LRUCache shards.
+    The total capacity is split as evenly as possible between the shards: the first
+    capacity % num_shards shards get one extra slot, so the shard capacities add up to exactly `capacity`.
+    """
+    def __init__(self, capacity: int, num_shards: int = 16):
+        if capacity <= 0:
+            raise ValueError("Invalid value of capacity")
+        if num_shards <= 0:
+            raise ValueError("Invalid value of num_shards")
+
+        # Never create more shards than there are slots to fill
+        num_shards = min(num_shards, capacity)
+        base, extra = divmod(capacity, num_shards)
+
+        self.capacity = capacity
+        self.num_shards = num_shards
+        self.shards = [LRUCache(base + (index < extra)) for index in range(num_shards)]
+        self.locks = [threading.Lock() for _ in range(num_shards)]
+
+        # Per-shard counters, only updated while holding the shard lock
+        self.hits = [0] * num_shards
+        self.misses = [0] * num_shards
+        self.evictions = [0] * num_shards
+
+    def _shard_index(self, key: Any) -> int:
+        """Pick the shard that owns the key"""
+        return hash(key) % self.num_shards
+
+    def get(self, key: Any) -> Any:
+        """Get the value of the key if it exists in the cache, otherwise return -1"""
+        index = self._shard_index(key)
+        shard = self.shards[index]
+
+        with self.locks[index]:
+            if key not in shard.cache:
+                self.misses[index] += 1
+                return -1
+
+            self.hits[index] += 1
+            return shard.get(key)
+
+    def put(self, key: Any, value: Any) -> None:
+        """Insert or update the value of the key in the cache"""
+        index = self._shard_index(key)
+        shard = self.shards[index]
+
+        with self.locks[index]:
+            # A new key in a full shard pushes out that shard's least recently used item
+            if key not in shard.cache and len(shard.cache) >= shard.capacity:
+                self.evictions[index] += 1
+
+            shard.put(key, value)
+
+    def __len__(self):
+        """Total number of items across all shards"""
+        total = 0
+        for index, shard in enumerate(self.shards):
+            with self.locks[index]:
+                total += len(shard.cache)
+        return total
+
+    def stats(self) -> Dict[str, Any]:
+        """Global view of size, hits, misses and evictions plus a per-shard breakdown"""
+        shards = []
+        for index, shard in enumerate(self.shards):
+            with self.locks[index]:
+                shards.append({
+                    "size": len(shard.cache),
+                    "capacity": shard.capacity,
+                    "hits": self.hits[index],
+                    "misses": self.misses[index],
+                    "evictions": self.evictions[index],
+                })
+
+        hits = sum(shard["hits"] for shard in shards)
+        misses = sum(shard["misses"] for shard in shards)
+        lookups = hits + misses
+
+        return {
+            "size": sum(shard["size"] for shard in shards),
+            "capacity": self.capacity,
+            "hits": hits,
+            "misses": misses,
+            "evictions": sum(shard["evictions"] for shard in shards),
+            "hit_ratio": hits / lookups if lookups else 0.0,
+            "shards": shards,
+        }
+
+    def __repr__(self):
+        """String representation of the cache for debugging"""
+        return f"ShardedLRUCache(capacity={self.capacity}, shards={self.num_shards}, size={len(self)})"
+
+
+def benchmark(thread_counts: Tuple[int, ...] = (1, 2, 4, 8, 16, 32), ops_per_thread: int = 20_000,
+              capacity: int = 10_000, key_space: int = 20_000, read_ratio: float = 0.8):
+    """
+    Compare the throughput of SingleLockLRUCache and ShardedLRUCache.
+    Every thread runs the same mix of reads and writes on random keys.
+
+    Note: in CPython the GIL still serialises the bytecode itself, so the gain
+    comes from threads no longer queueing on one lock, not from true parallelism.
+    """
+    def worker(cache, keys, barrier):
+        barrier.wait()
+        for key in keys:
+            if random.random() < read_ratio:
+                cache.get(key)
+            else:
+                cache.put(key, key)
+
+    print(f"{'threads':>8} | {'single lock ops/s':>18} | {'sharded ops/s':>14} | {'speedup':>7}")
+    for num_threads in thread_counts:
+        results = []
+        for cache in (SingleLockLRUCache(capacity), ShardedLRUCache(capacity)):
+            key_lists = [[random.randrange(key_space) for _ in range(ops_per_thread)]
+                         for _ in range(num_threads)]
+            barrier = threading.Barrier(num_threads + 1)
+            threads = [threading.Thread(target=worker, args=(cache, keys, barrier))
+                       for keys in key_lists]
+            for thread in threads:
+                thread.start()
+
+            start = time.perf_counter()
+            barrier.wait()
+            for thread in threads:
+                thread.join()
+            elapsed = time.perf_counter() - start
+
+            results.append(num_threads * ops_per_thread / elapsed)
+
+        print(f"{num_threads:>8} | {results[0]:>18,.0f} | {results[1]:>14,.0f} | {results[1] / results[0]:>6.2f}x")
+
+
+# Example usage
+if __name__ == "__main__":
+    sharded_cache = ShardedLRUCache(4, num_shards=2)
+    sharded_cache.put(1, 'A')
+    sharded_cache.put(2, 'B')
+    print(sharded_cache.get(1))  # Output: 'A'
+    print(sharded_cache.get(5))  # Output: -1 (not found)
+    print(sharded_cache.stats()["hit_ratio"])  # Output: 0.5
+
+    benchmark()
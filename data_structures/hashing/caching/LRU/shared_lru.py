@@ -0,0 +1,325 @@
+"""
+A Shared-memory LRU Cache lives in one `multiprocessing.shared_memory` block that every worker
+process attaches to, so N workers share one cache instead of holding N private copies.
+
+A private LRUCache per worker multiplies memory (hot keys are cached N times) and divides the
+hit rate (a value computed by one worker is invisible to the others). Python objects cannot live
+in shared memory, so everything is stored as fixed-size records in flat arrays:
+
+- Header: capacity, slot sizes, number of used slots, and shared hit/miss counters
+- Hash index: `buckets[h % table_size]` is the first slot of a chain, `hash_next[slot]` the next one
+- Recency list: `prev[slot]` / `next[slot]` slot indices, slot `capacity` being the sentinel
+  (`next[sentinel]` is the most recently used slot, `prev[sentinel]` the least recently used one)
+- Key and value slabs: every slot owns `key_size` bytes of key and `value_size` bytes of value
+
+Keys are `str` or `bytes` and values are `bytes`. Keys are hashed with CRC32 instead of `hash()`,
+because `hash()` of strings is randomized per process. A `multiprocessing.Lock` makes every
+operation atomic across processes.
+
+Complexity:
+- get/put: O(1) on average (O(chain length) for the hash lookup)
+- Space: O(capacity * (key_size + value_size)), allocated once
+
+Run the benchmark from the repository root:
+    python -m data_structures.hashing.caching.LRU.shared_lru
+"""
+
+import multiprocessing
+import random
+import tracemalloc
+import zlib
+from multiprocessing import resource_tracker, shared_memory
+from typing import Any, Dict, List, Union
+
+from data_structures.hashing.caching.LRU.lru import LRUCache
+
+# Header fields, one signed 64-bit integer each
+CAPACITY, KEY_SIZE, VALUE_SIZE, TABLE_SIZE, USED, HITS, MISSES = range(7)
+HEADER_FIELDS = 8
+
+
+def _align(size: int) -> int:
+    """Round a byte size up to a multiple of 8 so every array starts aligned"""
+    return (size + 7) & ~7
+
+
+class SharedLRUCache:
+    """
+    A fixed-size LRU Cache in shared memory, usable from several processes at once.
+    Create it with `SharedLRUCache(capacity, ...)` in the parent process and pass the instance
+    to the workers (as a Process argument or through a Pool initializer): they attach to the same block.
+    The creator should call `unlink()` once every process is done with it.
+    """
+    def __init__(self, capacity: int, key_size: int = 64, value_size: int = 256, lock=None):
+        if capacity <= 0 or key_size <= 0 or value_size <= 0:
+            raise ValueError("Invalid value of capacity, key_size or value_size")
+
+        table_size = 1 << (2 * capacity - 1).bit_length() # Power of two, at least 2x capacity
+        size = self._layout(capacity, key_size, value_size, table_size)
+        self.shm = shared_memory.SharedMemory(create=True, size=size)
+        self.lock = lock if lock is not None else multiprocessing.Lock()
+        self._attach()
+
+        header = self.header
+        header[CAPACITY] = capacity
+        header[KEY_SIZE] = key_size
+        header[VALUE_SIZE] = value_size
+        header[TABLE_SIZE] = table_size
+        header[USED] = header[HITS] = header[MISSES] = 0
+
+        sentinel = capacity
+        self.prev[sentinel] = sentinel
+        self.next[sentinel] = sentinel
+        for bucket in range(table_size):
+            self.buckets[bucket] = -1
+
+    def _layout(self, capacity: int, key_size: int, value_size: int, table_size: int) -> int:
+        """Compute the byte offset of every array in the block and return the total size"""
+        self._offsets = {}
+        offset = 0
+        for name, typecode, length in (("header", 'q', HEADER_FIELDS),
+                                       ("buckets", 'i', table_size),
+                                       ("prev", 'i', capacity + 1),
+                                       ("next", 'i', capacity + 1),
+                                       ("hash_next", 'i', capacity),
+                                       ("key_hash", 'I', capacity),
+                                       ("key_length", 'i', capacity),
+                                       ("value_length", 'i', capacity),
+                                       ("keys", 'B', capacity * key_size),
+                                       ("values", 'B', capacity * value_size)):
+            item_size = 8 if typecode == 'q' else 4 if typecode in 'iI' else 1
+            self._offsets[name] = (offset, typecode, length)
+            offset += _align(item_size * length)
+        return offset
+
+    def _attach(self):
+        """Create typed memoryviews over the shared block"""
+        buf = self.shm.buf
+        for name, (offset, typecode, length) in self._offsets.items():
+            item_size = 8 if typecode == 'q' else 4 if typecode in 'iI' else 1
+            view = buf[offset:offset + item_size * length]
+            setattr(self, name, view if typecode == 'B' else view.cast(typecode))
+
+        # The prev/next arrays hold one entry per slot plus the sentinel
+        self.capacity = self._offsets["prev"][2] - 1
+        self.sentinel = self.capacity
+
+    def __getstate__(self):
+        """Only the block name and the lock travel to worker processes"""
+        return {"name": self.shm.name, "lock": self.lock, "offsets": self._offsets}
+
+    def __setstate__(self, state):
+        """Attach to the shared block created by the parent process"""
+        self.lock = state["lock"]
+        self._offsets = state["offsets"]
+        self.shm = shared_memory.SharedMemory(name=state["name"])
+        # Only the creator owns the block; stop this process's tracker from unlinking it at exit
+        resource_tracker.unregister(self.shm._name, "shared_memory")
+        self._attach()
+
+    @staticmethod
+    def _encode_key(key: Union[str, bytes]) -> bytes:
+        return key.encode() if isinstance(key, str) else bytes(key)
+
+    def _find(self, key_bytes: bytes, key_hash: int) -> int:
+        """Return the slot holding the key, or -1. Must be called with the lock held."""
+        key_size = self.header[KEY_SIZE]
+        slot = self.buckets[key_hash & (self.header[TABLE_SIZE] - 1)]
+        while slot != -1:
+            if self.key_hash[slot] == key_hash and self.key_length[slot] == len(key_bytes):
+                start = slot * key_size
+                if self.keys[start:start + len(key_bytes)] == key_bytes:
+                    return slot
+            slot = self.hash_next[slot]
+        return -1
+
+    def _unlink_hash(self, slot: int):
+        """Remove a slot from its hash chain"""
+        bucket = self.key_hash[slot] & (self.header[TABLE_SIZE] - 1)
+        current = self.buckets[bucket]
+        if current == slot:
+            self.buckets[bucket] = self.hash_next[slot]
+            return
+        while self.hash_next[current] != slot:
+            current = self.hash_next[current]
+        self.hash_next[current] = self.hash_next[slot]
+
+    def _del_slot(self, slot: int):
+        """Unlink a slot from the recency list"""
+        prev_slot = self.prev[slot]
+        next_slot = self.next[slot]
+        self.next[prev_slot] = next_slot
+        self.prev[next_slot] = prev_slot
+
+    def _add_slot(self, slot: int):
+        """Link a slot right after the sentinel (most recently used position)"""
+        first = self.next[self.sentinel]
+        self.next[self.sentinel] = slot
+        self.prev[slot] = self.sentinel
+        self.next[slot] = first
+        self.prev[first] = slot
+
+    def get(self, key: Union[str, bytes], default: Any = -1) -> Any:
+        """Get the value of the key if it exists in the cache, otherwise return default (-1)"""
+        key_bytes = self._encode_key(key)
+        key_hash = zlib.crc32(key_bytes)
+
+        with self.lock:
+            slot = self._find(key_bytes, key_hash)
+            if slot == -1:
+                self.header[MISSES] += 1
+                return default
+
+            self.header[HITS] += 1
+            self._del_slot(slot)
+            self._add_slot(slot)
+
+            start = slot * self.header[VALUE_SIZE]
+            return bytes(self.values[start:start + self.value_length[slot]])
+
+    def put(self, key: Union[str, bytes], value: bytes) -> None:
+        """Insert or update the value of the key in the cache"""
+        key_bytes = self._encode_key(key)
+        key_hash = zlib.crc32(key_bytes)
+        key_size = self.header[KEY_SIZE]
+        value_size = self.header[VALUE_SIZE]
+        if len(key_bytes) > key_size:
+            raise ValueError(f"Key is longer than key_size ({key_size} bytes)")
+        if len(value) > value_size:
+            raise ValueError(f"Value is longer than value_size ({value_size} bytes)")
+
+        with self.lock:
+            slot = self._find(key_bytes, key_hash)
+
+            if slot != -1:
+                # Existing key: overwrite the value in place
+                self._del_slot(slot)
+            else:
+                if self.header[USED] < self.capacity:
+                    # Take the next slot that has never been used
+                    slot = self.header[USED]
+                    self.header[USED] += 1
+                else:
+                    # Reuse the slot of the least recently used entry
+                    slot = self.prev[self.sentinel]
+                    self._del_slot(slot)
+                    self._unlink_hash(slot)
+
+                start = slot * key_size
+                self.keys[start:start + len(key_bytes)] = key_bytes
+                self.key_length[slot] = len(key_bytes)
+                self.key_hash[slot] = key_hash
+
+                bucket = key_hash & (self.header[TABLE_SIZE] - 1)
+                self.hash_next[slot] = self.buckets[bucket]
+                self.buckets[bucket] = slot
+
+            start = slot * value_size
+            self.values[start:start + len(value)] = value
+            self.value_length[slot] = len(value)
+            self._add_slot(slot)
+
+    def __len__(self):
+        return self.header[USED]
+
+    def stats(self) -> Dict[str, Union[int, float]]:
+        """Hits and misses summed over every process using the cache"""
+        with self.lock:
+            hits, misses = self.header[HITS], self.header[MISSES]
+        return {"hits": hits, "misses": misses,
+                "hit_ratio": hits / (hits + misses) if hits + misses else 0.0,
+                "bytes": self.shm.size}
+
+    def close(self):
+        """Detach this process from the shared block"""
+        for name in self._offsets:
+            getattr(self, name).release()
+        self.shm.close()
+
+    def unlink(self):
+        """Free the shared block. Call once, from the creating process."""
+        self.close()
+        self.shm.unlink()
+
+
+def _zipf_keys(count: int, num_keys: int, seed: int) -> List[str]:
+    """Keys with a skewed popularity, like real request traffic"""
+    rng = random.Random(seed)
+    weights = [1 / (rank + 1) for rank in range(num_keys)]
+    return [f"key:{rank}" for rank in rng.choices(range(num_keys), weights, k=count)]
+
+
+def _private_worker(capacity: int, keys: List[str], results):
+    """Read-through traffic against a private LRUCache; reports hits and traced memory"""
+    tracemalloc.start()
+    cache = LRUCache(capacity)
+    hits = 0
+    for key in keys:
+        if cache.get(key) == -1:
+            cache.put(key, key.encode() * 4)
+        else:
+            hits += 1
+    memory, _ = tracemalloc.get_traced_memory()
+    results.put((hits, len(keys), memory))
+
+
+def _shared_worker(cache: SharedLRUCache, keys: List[str], results):
+    """Read-through traffic against the shared cache"""
+    hits = 0
+    for key in keys:
+        if cache.get(key) == -1:
+            cache.put(key, key.encode() * 4)
+        else:
+            hits += 1
+    cache.close()
+    results.put((hits, len(keys), 0))
+
+
+def benchmark(num_workers: int = 4, capacity_per_worker: int = 2_000,
+              requests_per_worker: int = 50_000, num_keys: int = 50_000):
+    """
+    Compare N private LRUCache instances of `capacity_per_worker` entries each with one shared
+    cache of N * capacity_per_worker entries, on aggregate hit rate and memory.
+    """
+    traces = [_zipf_keys(requests_per_worker, num_keys, seed) for seed in range(num_workers)]
+
+    for label in ("private", "shared"):
+        results = multiprocessing.Queue()
+        shared_cache = None
+        if label == "private":
+            workers = [multiprocessing.Process(target=_private_worker,
+                                               args=(capacity_per_worker, keys, results))
+                       for keys in traces]
+        else:
+            shared_cache = SharedLRUCache(num_workers * capacity_per_worker, key_size=16, value_size=64)
+            workers = [multiprocessing.Process(target=_shared_worker, args=(shared_cache, keys, results))
+                       for keys in traces]
+
+        for worker in workers:
+            worker.start()
+        outcomes = [results.get() for _ in workers]
+        for worker in workers:
+            worker.join()
+
+        hits = sum(outcome[0] for outcome in outcomes)
+        requests = sum(outcome[1] for outcome in outcomes)
+        memory = sum(outcome[2] for outcome in outcomes)
+        if shared_cache is not None:
+            memory = shared_cache.stats()["bytes"]
+            shared_cache.unlink()
+
+        print(f"{label:>8}: aggregate hit rate {hits / requests:.3f}, memory {memory / 2 ** 20:.1f} MB")
+
+
+# Example usage
+if __name__ == "__main__":
+    shared_cache = SharedLRUCache(2, key_size=8, value_size=8)
+    shared_cache.put("a", b"A")
+    shared_cache.put("b", b"B")
+    print(shared_cache.get("a"))   # Output: b'A'
+    shared_cache.put("c", b"C")    # Evicts "b"
+    print(shared_cache.get("b"))   # Output: -1 (not found)
+    print(shared_cache.stats()["hit_ratio"])  # Output: 0.5
+    shared_cache.unlink()
+
+    benchmark()
@@ -0,0 +1,376 @@
+"""
+A Two-tier LRU Cache keeps hot entries in memory and spills evicted entries to local disk.
+
+When the in-memory LRUCache evicts an entry, the value is normally gone, and recomputing it
+can cost far more than reading it back from disk. This cache adds a second tier:
+
+1. Memory tier: a regular LRUCache. Its eviction hook serializes every evicted entry
+   into the disk tier instead of dropping it.
+
+2. Disk tier: an append-only segment file with an in-memory index (key -> offset, length).
+   Records are read back through `mmap`, so a lookup is a dictionary access plus a slice
+   of the mapped file. Reading an entry from disk promotes it back into memory.
+
+Record layout (little-endian):
+    flags (1 byte) | key length (4) | value length (4) | CRC32 of key + value (4) | key | value
+Keys and values are serialized with `pickle`. A record with flags = 0 is a tombstone that
+marks the key as deleted.
+
+Overwritten, promoted and deleted records leave dead bytes behind. Once they exceed a fraction
+of the file, the segment is compacted by copying the live records into a new file, either inline
+or on a background thread. The disk tier has its own byte budget: when the live records exceed it,
+the oldest spilled entries are dropped first.
+
+Because the index is rebuilt by scanning the segment on startup (stopping at a torn or corrupted
+trailing record), the disk tier survives a process restart. Closing the cache spills the memory
+tier to disk as well, so a restarted cache starts warm.
+
+Note: only open segment files written by this cache; unpickling untrusted data is unsafe.
+
+Complexity:
+- get/put: O(1) in memory; O(record size) when a record is read from or written to disk
+- Compaction: O(live bytes), of which only the replay of the records appended meanwhile holds the lock
+"""
+
+import logging
+import mmap
+import os
+import pickle
+import struct
+import tempfile
+import threading
+import zlib
+from typing import Any, Optional
+
+from data_structures.hashing.caching.LRU.lru import MISSING, LRUCache
+
+RECORD_HEADER = struct.Struct('<BIII') # flags, key length, value length, CRC32
+LIVE = 1
+TOMBSTONE = 0
+
+logger = logging.getLogger(__name__)
+
+
+class DiskTier:
+    """
+    An append-only, memory-mapped segment file of pickled key-value records.
+
+    Args:
+      path (str): Location of the segment file. An existing file is reloaded.
+      max_bytes (int): Budget for the live records. The oldest entries are dropped beyond it.
+      compact_ratio (float): Compact once dead bytes exceed this fraction of the file.
+      background (bool): Compact on a daemon thread instead of inside the write that triggers it.
+    """
+    def __init__(self, path: str, max_bytes: int, compact_ratio: float = 0.5, background: bool = True):
+        if max_bytes <= 0:
+            raise ValueError("Invalid value of max_bytes")
+
+        self.path = path
+        self.max_bytes = max_bytes
+        self.compact_ratio = compact_ratio
+        self.index = {} # key -> (offset, record length), oldest spilled key first
+        self.live_bytes = 0
+        self.dead_bytes = 0
+        self.lock = threading.RLock()
+        self._compacting = threading.Lock() # Held for the whole compaction, including the unlocked copy
+
+        self._file = open(path, 'a+b')
+        self._mmap: Optional[mmap.mmap] = None
+        self._load()
+
+        self._compact_needed = threading.Event()
+        self._closed = False
+        self._compactor = None
+        if background:
+            self._compactor = threading.Thread(target=self._compact_loop, daemon=True)
+            self._compactor.start()
+
+    def _file_size(self) -> int:
+        return os.fstat(self._file.fileno()).st_size
+
+    def _view(self, end: int) -> mmap.mmap:
+        """Return a mapping of the file that covers at least `end` bytes, remapping after appends"""
+        if self._mmap is None or len(self._mmap) < end:
+            if self._mmap is not None:
+                self._mmap.close()
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._mmap
+
+    def _load(self):
+        """Rebuild the index by scanning the segment, dropping a torn trailing record"""
+        size = self._file_size()
+        if size == 0:
+            return
+
+        view = self._view(size)
+        offset = 0
+        while offset + RECORD_HEADER.size <= size:
+            flags, key_length, value_length, checksum = RECORD_HEADER.unpack_from(view, offset)
+            start = offset + RECORD_HEADER.size
+            end = start + key_length + value_length
+            if end > size or zlib.crc32(view[start:end]) != checksum:
+                break
+
+            key = pickle.loads(view[start:start + key_length])
+            self._drop_from_index(key)
+            if flags == LIVE:
+                self.index[key] = (offset, end - offset)
+                self.live_bytes += end - offset
+            else:
+                self.dead_bytes += end - offset
+            offset = end
+
+        # Anything after the last valid record is a partial write from a crash
+        if offset < size:
+            self._mmap.close()
+            self._mmap = None
+            self._file.truncate(offset)
+
+    def _drop_from_index(self, key: Any):
+        """Forget the current record of the key, turning its bytes into dead space"""
+        entry = self.index.pop(key, None)
+        if entry is not None:
+            self.live_bytes -= entry[1]
+            self.dead_bytes += entry[1]
+
+    def _append(self, flags: int, key_bytes: bytes, value_bytes: bytes) -> int:
+        """Append one record to the end of the segment and return its offset"""
+        payload = key_bytes + value_bytes
+        header = RECORD_HEADER.pack(flags, len(key_bytes), len(value_bytes), zlib.crc32(payload))
+        self._file.seek(0, os.SEEK_END)
+        offset = self._file.tell()
+        self._file.write(header + payload)
+        self._file.flush()
+        return offset
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        """Read the value of the key from disk, or return default"""
+        with self.lock:
+            entry = self.index.get(key)
+            if entry is None:
+                return default
+
+            offset, length = entry
+            view = self._view(offset + length)
+            _, key_length, value_length, _ = RECORD_HEADER.unpack_from(view, offset)
+            start = offset + RECORD_HEADER.size + key_length
+            return pickle.loads(view[start:start + value_length])
+
+    def put(self, key: Any, value: Any) -> bool:
+        """Write the key-value pair to disk. Returns False if the record exceeds the whole budget."""
+        key_bytes = pickle.dumps(key)
+        value_bytes = pickle.dumps(value)
+        length = RECORD_HEADER.size + len(key_bytes) + len(value_bytes)
+
+        with self.lock:
+            if length > self.max_bytes:
+                # The old record must not resurface after a restart either
+                self.delete(key)
+                return False
+
+            self._drop_from_index(key)
+
+            # Drop the oldest spilled entries until the new record fits in the budget
+            while self.live_bytes + length > self.max_bytes:
+                self.delete(next(iter(self.index)))
+
+            offset = self._append(LIVE, key_bytes, value_bytes)
+            self.index[key] = (offset, length)
+            self.live_bytes += length
+            self._check_compaction()
+            return True
+
+    def delete(self, key: Any) -> bool:
+        """Remove the key from disk by appending a tombstone. Returns whether it was present."""
+        with self.lock:
+            if key not in self.index:
+                return False
+
+            self._drop_from_index(key)
+            key_bytes = pickle.dumps(key)
+            self._append(TOMBSTONE, key_bytes, b'')
+            self.dead_bytes += RECORD_HEADER.size + len(key_bytes)
+            self._check_compaction()
+            return True
+
+    def _check_compaction(self):
+        """Start a compaction once the dead bytes pass the configured fraction of the file"""
+        total = self.live_bytes + self.dead_bytes
+        if total and self.dead_bytes > self.compact_ratio * total:
+            if self._compactor is not None:
+                self._compact_needed.set()
+            else:
+                self.compact()
+
+    def _compact_loop(self):
+        """Body of the background compaction thread"""
+        while True:
+            self._compact_needed.wait()
+            self._compact_needed.clear()
+            if self._closed:
+                return
+            try:
+                self.compact()
+            except Exception:
+                # The segment is left as it was; keep the thread alive for the next attempt
+                logger.exception("Compaction of %s failed", self.path)
+
+    def compact(self):
+        """
+        Copy the live records into a fresh segment and swap it in, reclaiming the dead bytes.
+        The copy works on a snapshot of the index without holding the lock, so reads, writes and
+        spills go on meanwhile. The records they append to the old segment in the meantime are
+        replayed onto the new one under the lock, right before the swap.
+        If anything fails, the temporary file is removed and the old segment stays in use.
+        """
+        if not self._compacting.acquire(blocking=False):
+            return # Another compaction is already running
+
+        temp_path = None
+        try:
+            with self.lock:
+                if self._closed:
+                    return
+                snapshot = list(self.index.values())
+                copy_end = self._file_size()
+                source = open(self.path, 'rb') # Own handle: the old segment below copy_end never changes
+
+            # A unique name next to the segment, so os.replace stays on one file system
+            directory, name = os.path.split(os.path.abspath(self.path))
+            fd, temp_path = tempfile.mkstemp(prefix=name + '.', suffix='.compact', dir=directory)
+            moved = {} # Old offset -> new offset of every copied record
+            copied = 0
+            with source, os.fdopen(fd, 'wb') as new_file:
+                if snapshot:
+                    with mmap.mmap(source.fileno(), copy_end, access=mmap.ACCESS_READ) as view:
+                        for old_offset, length in snapshot:
+                            new_file.write(view[old_offset:old_offset + length])
+                            moved[old_offset] = copied
+                            copied += length
+                new_file.flush()
+                os.fsync(new_file.fileno())
+
+                with self.lock:
+                    if self._closed:
+                        return
+
+                    # Replay what was appended during the copy: those records override the copied ones
+                    # exactly as they do in the old segment, including after a restart
+                    end = self._file_size()
+                    tail = self._view(end)[copy_end:end] if end > copy_end else b''
+                    new_file.write(tail)
+                    new_file.flush()
+                    os.fsync(new_file.fileno())
+
+                    index = {}
+                    for key, (old_offset, length) in self.index.items():
+                        if old_offset < copy_end:
+                            index[key] = (moved[old_offset], length)
+                        else:
+                            index[key] = (old_offset - copy_end + copied, length)
+
+                    # Open the new segment before the swap and release the old handles only after it,
+                    # so a failure at any point leaves the tier on its old, still open segment
+                    new_segment = open(temp_path, 'a+b')
+                    try:
+                        os.replace(temp_path, self.path)
+                    except BaseException:
+                        new_segment.close()
+                        raise
+                    temp_path = None
+
+                    if self._mmap is not None:
+                        self._mmap.close()
+                        self._mmap = None
+                    self._file.close()
+                    self._file = new_segment
+                    self.index = index
+                    self.dead_bytes = copied + len(tail) - self.live_bytes
+        finally:
+            if temp_path is not None and os.path.exists(temp_path):
+                os.remove(temp_path)
+            self._compacting.release()
+
+    def __len__(self):
+        return len(self.index)
+
+    def close(self):
+        """Stop the compactor, wait for it to finish and close the segment file"""
+        with self.lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._compact_needed.set()
+
+        # A running compaction sees _closed once it needs the lock again, and gives up
+        if self._compactor is not None and self._compactor is not threading.current_thread():
+            self._compactor.join()
+
+        with self.lock:
+            if self._mmap is not None:
+                self._mmap.close()
+                self._mmap = None
+            self._file.close()
+
+
+class TieredLRUCache:
+    """
+    An LRU Cache with an in-memory tier of `capacity` items and a disk tier of `disk_max_bytes`.
+    Each key lives in exactly one tier: evicted entries move to disk and disk hits move back to memory.
+    """
+    def __init__(self, capacity: int, path: str, disk_max_bytes: int, background_compaction: bool = True):
+        self.disk = DiskTier(path, disk_max_bytes, background=background_compaction)
+        self.memory = LRUCache(capacity, on_evict=self.disk.put)
+
+    def get(self, key: Any, default: Any = -1) -> Any:
+        """Get the value of the key from memory or disk, otherwise return default (-1)"""
+        value = self.memory.get(key, MISSING)
+        if value is not MISSING:
+            return value
+
+        value = self.disk.get(key, MISSING)
+        if value is MISSING:
+            return default
+
+        # Promote the entry back into memory (which may spill another one to disk)
+        self.disk.delete(key)
+        self.memory.put(key, value)
+        return value
+
+    def put(self, key: Any, value: Any) -> None:
+        """Insert or update the value of the key in the memory tier"""
+        # A stale copy on disk must not resurface after the new value is evicted
+        self.disk.delete(key)
+        self.memory.put(key, value)
+
+    def __len__(self):
+        return len(self.memory.cache) + len(self.disk)
+
+    def close(self, spill_memory: bool = True):
+        """Close the cache, spilling the memory tier to disk first so a restart starts warm"""
+        if spill_memory:
+            # Spill the least recently used entries first so they are dropped first if over budget
+            node = self.memory.tail.prev
+            while node is not self.memory.head:
+                self.disk.put(node.key, node.data)
+                node = node.prev
+        self.disk.close()
+
+
+# Example usage
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as directory:
+        segment_path = os.path.join(directory, 'cache.seg')
+
+        tiered_cache = TieredLRUCache(2, segment_path, disk_max_bytes=1 << 20)
+        tiered_cache.put(1, 'A')
+        tiered_cache.put(2, 'B')
+        tiered_cache.put(3, 'C')         # Spills key 1 to disk
+        print(len(tiered_cache.disk))    # Output: 1
+        print(tiered_cache.get(1))       # Output: 'A' (read from disk, promoted to memory)
+        tiered_cache.close()
+
+        # The entries survive a restart
+        restarted_cache = TieredLRUCache(2, segment_path, disk_max_bytes=1 << 20)
+        print(restarted_cache.get(3))    # Output: 'C'
+        restarted_cache.close()